@@ -1,277 +1,169 @@
+import os
 import sys
-import random
-import math
-import logging
-import multiprocessing
-import torch
 import numpy as np
-from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-                             QPushButton, QSlider, QComboBox, QGroupBox, QFormLayout, QSpinBox,
-                             QFileDialog, QListWidget)
-from PyQt5.QtGui import QPainter, QColor, QPen, QBrush
-from PyQt5.QtCore import Qt, QTimer, QRectF
-from PyQt5.QtMultimedia import QSound
-from sklearn.neighbors import KDTree
-from torch.utils.data import DataLoader
-from pointnet2_ops import pointnet2_utils
-
-# Import 3D object detection model (e.g., PointRCNN)
-from pointrcnn.lib.net.point_rcnn import PointRCNN
-
-class RadarAlert(QMainWindow):
-    def __init__(self):
-        super().__init__()
-        self.initUI()
-        
-        self.radar_data = [[] for _ in range(7)]
-        
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_data)
-        self.timer.start(1000)
-
-        self.zoom_level = 1.0
-        self.use_real_data = False
-
-        # Setup logging
-        logging.basicConfig(filename='radar_alerts.log', level=logging.INFO,
-                            format='%(asctime)s - %(message)s')
-
-        # Load sound for critical alerts
-        self.alert_sound = QSound("alert.wav")
-
-        # Initialize 3D object detection model
-        self.object_detector = self.init_object_detector()
-
-        # Initialize data augmentation
-        self.data_augmentation = DataAugmentation()
-
-    def initUI(self):
-        self.setWindowTitle('Human Detection')
-        self.setGeometry(100, 100, 1000, 800)
-
-        central_widget = QWidget()
-        self.setCentralWidget(central_widget)
-        main_layout = QHBoxLayout(central_widget)
-
-        # Radar visualization
-        viz_layout = QVBoxLayout()
-        self.canvas = RadarCanvas(self)
-        viz_layout.addWidget(self.canvas)
-
-        self.alert_label = QLabel('No alerts')
-        self.alert_label.setAlignment(Qt.AlignCenter)
-        viz_layout.addWidget(self.alert_label)
-
-        main_layout.addLayout(viz_layout)
-
-        # Control panel
-        control_panel = QGroupBox("Control Panel")
-        control_layout = QFormLayout()
-
-        self.zoom_slider = QSlider(Qt.Horizontal)
-        self.zoom_slider.setRange(10, 200)
-        self.zoom_slider.setValue(100)
-        self.zoom_slider.valueChanged.connect(self.update_zoom)
-        control_layout.addRow("Zoom:", self.zoom_slider)
-
-        self.data_source_combo = QComboBox()
-        self.data_source_combo.addItems(["Simulated Data", "Real Data"])
-        self.data_source_combo.currentIndexChanged.connect(self.toggle_data_source)
-        control_layout.addRow("Data Source:", self.data_source_combo)
-
-        self.update_rate_spin = QSpinBox()
-        self.update_rate_spin.setRange(100, 5000)
-        self.update_rate_spin.setValue(1000)
-        self.update_rate_spin.setSingleStep(100)
-        self.update_rate_spin.valueChanged.connect(self.update_timer_interval)
-        control_layout.addRow("Update Rate (ms):", self.update_rate_spin)
-
-        self.data_format_combo = QComboBox()
-        self.data_format_combo.addItems(["Format 1", "Format 2", "Format 3"])
-        control_layout.addRow("Data Format:", self.data_format_combo)
-
-        self.calibration_button = QPushButton("Calibrate")
-        self.calibration_button.clicked.connect(self.calibrate_radar)
-        control_layout.addRow("Calibration:", self.calibration_button)
-
-        self.manual_correction_button = QPushButton("Manual Correction")
-        self.manual_correction_button.clicked.connect(self.open_manual_correction)
-        control_layout.addRow("Correction:", self.manual_correction_button)
-
-        control_panel.setLayout(control_layout)
-        main_layout.addWidget(control_panel)
-
-    def init_object_detector(self):
-        model = PointRCNN(num_classes=3, use_xyz=True)
-        model.cuda()
-        model.eval()
-        return model
-
-    def update_data(self):
-        if self.use_real_data:
-            self.radar_data = self.get_real_radar_data()
-        else:
-            self.simulate_radar_data()
-
-        # Apply data augmentation
-        self.radar_data = self.data_augmentation.augment(self.radar_data)
-
-        # Perform 3D object detection
-        detections = self.detect_3d_objects(self.radar_data)
-
-        self.check_alerts(detections)
-        self.canvas.update()
-
-    def simulate_radar_data(self):
-        for i in range(7):
-            self.radar_data[i] = []
-            if random.random() < 0.3:
-                distance = random.uniform(50, 300)
-                angle = random.uniform(0, 360)
-                self.radar_data[i].append((distance, angle))
-
-    def get_real_radar_data(self):
-        # Placeholder for real radar data input
-        # Replace this with your actual implementation
-        return [[] for _ in range(7)]
-
-    def detect_3d_objects(self, point_cloud):
-        # Convert point cloud to appropriate format for PointRCNN
-        points = torch.from_numpy(np.concatenate(point_cloud)).float().cuda()
-        points = points.view(1, -1, 4)  # Assuming 4 features: x, y, z, intensity
-
-        # Perform inference
-        with torch.no_grad():
-            pred_dicts = self.object_detector(points)
-
-        # Process predictions
-        detections = []
-        for pred_dict in pred_dicts:
-            for box, score, label in zip(pred_dict['pred_boxes'], pred_dict['pred_scores'], pred_dict['pred_labels']):
-                detections.append({
-                    'box': box.cpu().numpy(),
-                    'score': score.item(),
-                    'label': label.item()
-                })
-
-        return detections
-
-    def check_alerts(self, detections):
-        alerts = []
-        critical_alert = False
-
-        for i, detection in enumerate(detections):
-            distance = np.linalg.norm(detection['box'][:3])
-            if distance < 50:
-                alerts.append(f"CRITICAL: Object {i+1} at {distance:.1f} units")
-                critical_alert = True
-            elif distance < 100:
-                alerts.append(f"WARNING: Object {i+1} at {distance:.1f} units")
-
-        if alerts:
-            alert_text = "\n".join(alerts)
-            self.alert_label.setText(alert_text)
-            self.alert_label.setStyleSheet("background-color: red; color: white;")
-            logging.warning(alert_text)
-            if critical_alert:
-                self.alert_sound.play()
-        else:
-            self.alert_label.setText("No alerts")
-            self.alert_label.setStyleSheet("")
-
-    def update_zoom(self, value):
-        self.zoom_level = value / 100.0
-        self.canvas.update()
-
-    def toggle_data_source(self, index):
-        self.use_real_data = (index == 1)
-
-    def update_timer_interval(self, value):
-        self.timer.setInterval(value)
-
-    def calibrate_radar(self):
-        # Implement radar calibration process
-        calibration_file, _ = QFileDialog.getOpenFileName(self, "Select Calibration File")
-        if calibration_file:
-            # Perform calibration using the selected file
-            logging.info(f"Calibrating radar using file: {calibration_file}")
-            # Implement calibration logic here
-
-    def open_manual_correction(self):
-        self.correction_dialog = ManualCorrectionDialog(self.radar_data, self)
-        self.correction_dialog.show()
-
-class RadarCanvas(QWidget):
-    def __init__(self, parent):
-        super().__init__(parent)
-        self.parent = parent
-
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-
-        # Apply zoom
-        painter.scale(self.parent.zoom_level, self.parent.zoom_level)
-
-        # Draw port area (simplified)
-        painter.setPen(QPen(Qt.black, 2))
-        painter.setBrush(QBrush(QColor(200, 200, 200)))
-        painter.drawRect(50, 50, 700, 500)
-
-        # Draw storage tanks (simplified)
-        tank_positions = [(200, 200), (400, 200), (600, 200)]
-        for x, y in tank_positions:
-            painter.setBrush(QBrush(QColor(150, 150, 150)))
-            painter.drawEllipse(x-30, y-30, 60, 60)
-
-        # Draw vessel (simplified)
-        painter.setBrush(QBrush(QColor(150, 150, 150)))
-        painter.drawRect(100, 400, 300, 100)
-
-        # Draw radar positions
-        radar_positions = [
-            (100, 100), (700, 100), (400, 300),
-            (100, 500), (700, 500), (250, 300), (550, 300)
-        ]
-        for x, y in radar_positions:
-            painter.setPen(QPen(Qt.blue, 2))
-            painter.drawEllipse(x-5, y-5, 10, 10)
-
-        # Draw radar detections
-        painter.setPen(QPen(Qt.red, 2))
-        for i, detections in enumerate(self.parent.radar_data):
-            radar_x, radar_y = radar_positions[i]
-            for distance, angle in detections:
-                x = radar_x + distance * math.cos(math.radians(angle))
-                y = radar_y + distance * math.sin(math.radians(angle))
-                painter.drawLine(radar_x, radar_y, x, y)
-
-class ManualCorrectionDialog(QWidget):
-    def __init__(self, radar_data, parent=None):
-        super().__init__(parent)
-        self.radar_data = radar_data
-        self.initUI()
-
-    def initUI(self):
-        layout = QVBoxLayout()
-        self.setLayout(layout)
-
-        self.object_list = QListWidget()
-        layout.addWidget(self.object_list)
-
-        for i, detection in enumerate(self.radar_data):
-            self.object_list.addItem(f"Object {i+1}")
-
-        self.edit_button = QPushButton("Edit Object")
-        self.edit_button.clicked.connect(self.edit_object)
-        layout.addWidget(self.edit_button)
-
-    def edit_object(self):
-        selected_item = self.object_list.currentItem()
-        if selected_item:
-            index = self.object_list.row(selected_item)
-            # Open a dialog to edit the object's properties
-            # Implement the editing logic here
+
+# The GUI (PyQt5, QtMultimedia) lives in autolabellergui and the detection
+# model (torch, PointRCNN) is only imported when a detector is loaded, so
+# headless batch jobs can import this module without display libraries.
+GUI_CLASSES = ('RadarAlert', 'RadarCanvas', 'ManualCorrectionDialog')
+
+CRITICAL_DISTANCE = 50
+WARNING_DISTANCE = 100
+
+# Detector label ids start at 1 and index into CLASS_NAMES
+CLASS_NAMES = ('Car', 'Pedestrian', 'Cyclist')
+BACKGROUND_LABEL = 'Unlabeled'
+# Per-frame auto-label files written next to each point cloud, read by the manual labeller's queue
+AUTO_LABELS_SUFFIX = '_auto_labels.txt'
+AUTO_SCORES_SUFFIX = '_auto_scores.txt'
+AUTO_SCORE_PASSES_SUFFIX = '_auto_score_passes.txt'
+
+def load_object_detector(num_classes=3):
+    # Import 3D object detection model (e.g., PointRCNN)
+    from pointrcnn.lib.net.point_rcnn import PointRCNN
+
+    model = PointRCNN(num_classes=num_classes, use_xyz=True)
+    model.cuda()
+    model.eval()
+    return model
+
+def detect_3d_objects(model, point_cloud, cache=None, fingerprint=None):
+    # With a DetectionCache, unchanged inputs skip inference. Without an explicit fingerprint the
+    # cache hashes the model's weights once and reuses that. Raw detections are cached, so changing
+    # thresholds or post-processing still hits.
+    points = np.ascontiguousarray(np.concatenate(point_cloud), dtype=np.float32).reshape(-1, 4)  # x, y, z, intensity
+    if cache is not None:
+        if fingerprint is None:
+            fingerprint = cache.model_fingerprint(model)
+        key = cache.key(points, fingerprint)
+        detections = cache.get(key)
+        if detections is not None:
+            return detections
+
+    detections = run_detector(model, points)
+
+    if cache is not None:
+        cache.put(key, detections)
+    return detections
+
+def run_detector(model, points):
+    import torch
+
+    # Convert point cloud to appropriate format for PointRCNN
+    points = torch.from_numpy(points).cuda()
+    points = points.view(1, -1, 4)
+
+    # Perform inference
+    with torch.no_grad():
+        pred_dicts = model(points)
+
+    # Process predictions
+    detections = []
+    for pred_dict in pred_dicts:
+        for box, score, label in zip(pred_dict['pred_boxes'], pred_dict['pred_scores'], pred_dict['pred_labels']):
+            detections.append({
+                'box': box.cpu().numpy(),
+                'score': score.item(),
+                'label': label.item()
+            })
+    return detections
+
+def points_in_boxes(points, boxes):
+    # boxes are (x, y, z, dx, dy, dz, heading) with z at the box centre; returns a (boxes, points) mask
+    offsets = points[None, :, :3] - boxes[:, None, :3]
+    cos = np.cos(boxes[:, 6])[:, None]
+    sin = np.sin(boxes[:, 6])[:, None]
+    local_x = offsets[..., 0] * cos + offsets[..., 1] * sin
+    local_y = -offsets[..., 0] * sin + offsets[..., 1] * cos
+    half_size = boxes[:, None, 3:6] / 2
+    return ((np.abs(local_x) <= half_size[..., 0]) & (np.abs(local_y) <= half_size[..., 1]) &
+            (np.abs(offsets[..., 2]) <= half_size[..., 2]))
+
+def point_labels_from_detections(points, detections):
+    # Each point takes the class and score of the highest-scoring box containing it
+    labels = np.full(len(points), BACKGROUND_LABEL, dtype=object)
+    scores = np.zeros(len(points))
+    if not detections:
+        return labels.astype(str), scores
+
+    boxes = np.stack([detection['box'] for detection in detections])
+    box_scores = np.array([detection['score'] for detection in detections])
+    box_labels = np.array([CLASS_NAMES[detection['label'] - 1] for detection in detections], dtype=object)
+
+    inside = points_in_boxes(points, boxes)
+    masked_scores = np.where(inside, box_scores[:, None], -1.0)
+    best_box = np.argmax(masked_scores, axis=0)
+    best_score = masked_scores[best_box, np.arange(len(points))]
+    hit = best_score >= 0
+    labels[hit] = box_labels[best_box[hit]]
+    scores[hit] = best_score[hit]
+    return labels.astype(str), scores
+
+def autolabel_frame(model, points, augmentation=None, num_passes=0, cache=None, fingerprint=None):
+    if cache is not None and fingerprint is None:
+        fingerprint = cache.model_fingerprint(model)
+    detections = detect_3d_objects(model, [points], cache, fingerprint)
+    labels, scores = point_labels_from_detections(points, detections)
+
+    # Re-run the detector on augmented copies; the spread of per-point scores measures model uncertainty.
+    # With a cache, each pass is seeded from the frame's cache key and the pass index, so an unchanged
+    # frame gets the same augmented copies on every run and their detections are cached as well.
+    # Dropout is left out so that each pass scores the same points.
+    score_passes = None
+    if augmentation is not None and num_passes > 0:
+        frame_key = cache.key(np.asarray(points, dtype=np.float32), fingerprint) if cache is not None else None
+        passes = []
+        for i in range(num_passes):
+            rng = np.random.default_rng([int(frame_key, 16), i]) if frame_key is not None else None
+            augmented = augmentation.augment(points, rng, keep_points=True)
+            _, pass_scores = point_labels_from_detections(
+                augmented, detect_3d_objects(model, [augmented], cache, fingerprint))
+            passes.append(pass_scores)
+        score_passes = np.stack(passes)
+
+    return labels, scores, score_passes
+
+def save_auto_labels(point_cloud_path, labels, scores, score_passes=None):
+    stem = os.path.splitext(point_cloud_path)[0]
+    np.savetxt(stem + AUTO_LABELS_SUFFIX, labels, fmt='%s')
+    np.savetxt(stem + AUTO_SCORES_SUFFIX, scores, fmt='%.4f')
+    if score_passes is not None:
+        np.savetxt(stem + AUTO_SCORE_PASSES_SUFFIX, score_passes, fmt='%.4f')
+
+def iq_range_detections(iq_samples, max_range=300.0, range_bins=512, threshold=6.0, max_detections=16):
+    # Stand-in for format-specific decoding: range bins whose FFT magnitude is a local maximum well
+    # above the median noise floor become (distance, angle) detections. A single-channel capture
+    # carries no bearing, so every angle is 0.
+    profile = np.abs(np.fft.fft(iq_samples[:2 * range_bins]))[:range_bins]
+    noise_floor = np.median(profile) + 1e-12
+    local_max = np.r_[False, (profile[1:-1] >= profile[:-2]) & (profile[1:-1] >= profile[2:]), False]
+    peaks = np.nonzero(local_max & (profile > threshold * noise_floor))[0]
+    peaks = peaks[np.argsort(profile[peaks])[::-1][:max_detections]]
+    distances = np.sort(peaks) * max_range / range_bins
+    return np.column_stack([distances, np.zeros(len(distances))])
+
+def polar_to_point_cloud(polar, radar_position, intensity=1.0):
+    polar = np.asarray(polar, dtype=np.float64).reshape(-1, 2)
+    radians = np.radians(polar[:, 1])
+    points = np.zeros((len(polar), 4), dtype=np.float32)
+    points[:, 0] = radar_position[0] + polar[:, 0] * np.cos(radians)
+    points[:, 1] = radar_position[1] + polar[:, 0] * np.sin(radians)
+    points[:, 3] = intensity
+    return points
+
+def classify_alerts(detections):
+    alerts = []
+    critical_alert = False
+
+    for i, detection in enumerate(detections):
+        distance = np.linalg.norm(detection['box'][:3])
+        if distance < CRITICAL_DISTANCE:
+            alerts.append(f"CRITICAL: Object {i+1} at {distance:.1f} units")
+            critical_alert = True
+        elif distance < WARNING_DISTANCE:
+            alerts.append(f"WARNING: Object {i+1} at {distance:.1f} units")
+
+    return alerts, critical_alert
 
 class DataAugmentation:
     def __init__(self):
@@ -280,31 +172,48 @@ class DataAugmentation:
             self.random_dropout,
             self.random_shift
         ]
-
-    def augment(self, point_cloud):
+        # Methods that keep every point in place in the array, so per-point results stay comparable
+        self.point_preserving_methods = [self.random_noise, self.random_shift]
+
+    def augment(self, point_cloud, rng=None, keep_points=False):
+        # rng is a numpy Generator; pass a seeded one to make the augmentation reproducible.
+        # keep_points skips dropout, which moves points onto the first one.
+        if rng is None:
+            rng = np.random.default_rng()
+        methods = self.point_preserving_methods if keep_points else self.augmentation_methods
         augmented_cloud = point_cloud.copy()
-        for method in self.augmentation_methods:
-            if random.random() < 0.5:  # 50% chance to apply each augmentation
-                augmented_cloud = method(augmented_cloud)
+        for method in methods:
+            if rng.random() < 0.5:  # 50% chance to apply each augmentation
+                augmented_cloud = method(augmented_cloud, rng)
         return augmented_cloud
 
-    def random_noise(self, point_cloud):
-        noise = np.random.normal(0, 0.02, point_cloud.shape)
+    def random_noise(self, point_cloud, rng):
+        noise = rng.normal(0, 0.02, point_cloud.shape)
         return point_cloud + noise
 
-    def random_dropout(self, point_cloud):
-        dropout_ratio = np.random.random() * 0.2
-        drop_idx = np.where(np.random.random((point_cloud.shape[0])) <= dropout_ratio)[0]
+    def random_dropout(self, point_cloud, rng):
+        dropout_ratio = rng.random() * 0.2
+        drop_idx = np.where(rng.random(point_cloud.shape[0]) <= dropout_ratio)[0]
         if len(drop_idx) > 0:
             point_cloud[drop_idx] = point_cloud[0]  # set to the first point
         return point_cloud
 
-    def random_shift(self, point_cloud):
-        shift = np.random.uniform(-0.1, 0.1, 3)
+    def random_shift(self, point_cloud, rng):
+        shift = rng.uniform(-0.1, 0.1, 3)
         point_cloud[:, :3] += shift
         return point_cloud
 
+def __getattr__(name):
+    # Resolve the Qt classes on first access so `from autolabeller import RadarAlert` keeps working
+    if name in GUI_CLASSES:
+        import autolabellergui
+        return getattr(autolabellergui, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 def main():
+    from PyQt5.QtWidgets import QApplication
+    from autolabellergui import RadarAlert
+
     app = QApplication(sys.argv)
     ex = RadarAlert()
     ex.show()
@@ -0,0 +1,333 @@
+import os
+import sys
+import math
+import time
+import logging
+import numpy as np
+from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
+                             QPushButton, QSlider, QComboBox, QGroupBox, QFormLayout, QSpinBox,
+                             QFileDialog, QListWidget)
+from PyQt5.QtGui import QPainter, QColor, QPen, QBrush
+from PyQt5.QtCore import Qt, QTimer, QPointF
+
+from autolabeller import (DataAugmentation, load_object_detector, detect_3d_objects, classify_alerts,
+                          iq_range_detections, polar_to_point_cloud, main)
+from radarscenesimulator import RadarSceneSimulator, RADAR_POSITIONS
+
+# Seconds between attempts to attach to the extractor's shared memory ring, doubling up to the maximum
+RING_RETRY_DELAY = 1.0
+RING_MAX_RETRY_DELAY = 30.0
+# Ticks without a new frame before checking whether the extractor restarted with a new ring
+RING_STALE_TICKS = 5
+
+class RadarAlert(QMainWindow):
+    def __init__(self):
+        super().__init__()
+        self.initUI()
+        
+        self.radar_data = [[] for _ in range(len(RADAR_POSITIONS))]
+        self.point_cloud = [np.empty((0, 4), dtype=np.float32) for _ in range(len(RADAR_POSITIONS))]
+        self.simulator = RadarSceneSimulator(num_targets=10, radar_positions=RADAR_POSITIONS, rate_hz=1.0)
+        
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.update_data)
+        self.timer.start(1000)
+
+        self.zoom_level = 1.0
+        self.use_real_data = False
+
+        # Live frames from RadarDataExtractor.start_shared_memory, attached on first use
+        self.frame_ring = None
+        self.next_ring_attempt = 0.0
+        self.ring_retry_delay = RING_RETRY_DELAY
+        self.stale_ticks = 0
+        self.last_frame_seq = 0
+        self.last_capture_time = None
+        self.real_radar_index = 0
+
+        # Setup logging
+        logging.basicConfig(filename='radar_alerts.log', level=logging.INFO,
+                            format='%(asctime)s - %(message)s')
+
+        # Sound for critical alerts, loaded on the first critical alert
+        self.alert_sound = None
+
+        # Initialize 3D object detection model
+        self.object_detector = self.init_object_detector()
+
+        # Initialize data augmentation
+        self.data_augmentation = DataAugmentation()
+
+    def initUI(self):
+        self.setWindowTitle('Human Detection')
+        self.setGeometry(100, 100, 1000, 800)
+
+        central_widget = QWidget()
+        self.setCentralWidget(central_widget)
+        main_layout = QHBoxLayout(central_widget)
+
+        # Radar visualization
+        viz_layout = QVBoxLayout()
+        self.canvas = RadarCanvas(self)
+        viz_layout.addWidget(self.canvas)
+
+        self.alert_label = QLabel('No alerts')
+        self.alert_label.setAlignment(Qt.AlignCenter)
+        viz_layout.addWidget(self.alert_label)
+
+        self.latency_label = QLabel('Latency: -')
+        self.latency_label.setAlignment(Qt.AlignCenter)
+        viz_layout.addWidget(self.latency_label)
+
+        main_layout.addLayout(viz_layout)
+
+        # Control panel
+        control_panel = QGroupBox("Control Panel")
+        control_layout = QFormLayout()
+
+        self.zoom_slider = QSlider(Qt.Horizontal)
+        self.zoom_slider.setRange(10, 200)
+        self.zoom_slider.setValue(100)
+        self.zoom_slider.valueChanged.connect(self.update_zoom)
+        control_layout.addRow("Zoom:", self.zoom_slider)
+
+        self.data_source_combo = QComboBox()
+        self.data_source_combo.addItems(["Simulated Data", "Real Data"])
+        self.data_source_combo.currentIndexChanged.connect(self.toggle_data_source)
+        control_layout.addRow("Data Source:", self.data_source_combo)
+
+        self.update_rate_spin = QSpinBox()
+        self.update_rate_spin.setRange(100, 5000)
+        self.update_rate_spin.setValue(1000)
+        self.update_rate_spin.setSingleStep(100)
+        self.update_rate_spin.valueChanged.connect(self.update_timer_interval)
+        control_layout.addRow("Update Rate (ms):", self.update_rate_spin)
+
+        self.data_format_combo = QComboBox()
+        self.data_format_combo.addItems(["Format 1", "Format 2", "Format 3"])
+        control_layout.addRow("Data Format:", self.data_format_combo)
+
+        self.calibration_button = QPushButton("Calibrate")
+        self.calibration_button.clicked.connect(self.calibrate_radar)
+        control_layout.addRow("Calibration:", self.calibration_button)
+
+        self.manual_correction_button = QPushButton("Manual Correction")
+        self.manual_correction_button.clicked.connect(self.open_manual_correction)
+        control_layout.addRow("Correction:", self.manual_correction_button)
+
+        control_panel.setLayout(control_layout)
+        main_layout.addWidget(control_panel)
+
+    def init_object_detector(self):
+        return load_object_detector(num_classes=3)
+
+    def update_data(self):
+        if self.use_real_data:
+            self.radar_data = self.get_real_radar_data()
+            self.point_cloud = [polar_to_point_cloud(detections, RADAR_POSITIONS[i])
+                                for i, detections in enumerate(self.radar_data)]
+        else:
+            self.simulate_radar_data()
+
+        # Apply data augmentation
+        point_cloud = self.data_augmentation.augment(np.concatenate(self.point_cloud))
+
+        # Perform 3D object detection
+        detections = self.detect_3d_objects(point_cloud)
+
+        self.check_alerts(detections)
+        self.canvas.update()
+
+        if self.use_real_data and self.last_capture_time is not None:
+            latency_ms = (time.monotonic() - self.last_capture_time) * 1000
+            self.latency_label.setText(f"Latency: {latency_ms:.1f} ms (frame {self.last_frame_seq})")
+
+    def simulate_radar_data(self):
+        frame = self.simulator.step()
+        self.radar_data = frame['polar']
+        self.point_cloud = frame['point_cloud']
+
+    def get_real_radar_data(self):
+        radar_data = [np.empty((0, 2)) for _ in range(len(RADAR_POSITIONS))]
+        if self.frame_ring is None and not self.connect_frame_ring():
+            return radar_data
+
+        # Latest-frame semantics: skip straight to the newest frame, keep the current data if none arrived
+        frame = self.frame_ring.read_latest(self.last_frame_seq)
+        if frame is None:
+            self.stale_ticks += 1
+            if self.stale_ticks >= RING_STALE_TICKS:
+                self.stale_ticks = 0
+                self.check_frame_ring()
+            return self.radar_data
+        self.stale_ticks = 0
+        seq, capture_time, iq_samples = frame
+        radar_data[self.real_radar_index] = iq_range_detections(iq_samples)
+        self.last_frame_seq = seq
+        self.last_capture_time = capture_time
+        return radar_data
+
+    def check_frame_ring(self):
+        # A restarted extractor unlinks the old block and creates a new one under the same name,
+        # which this process would never see through its old mapping
+        from sharedframering import SharedFrameRing
+        from radarrawdataextractor import SHARED_FRAMES_NAME
+
+        try:
+            ring = SharedFrameRing.attach(SHARED_FRAMES_NAME)
+        except FileNotFoundError:
+            ring = None
+        if ring is not None and ring.generation == self.frame_ring.generation:
+            ring.close()
+            return
+        logging.info(f"Live radar frames '{SHARED_FRAMES_NAME}' were replaced or removed, re-attaching")
+        self.frame_ring.close()
+        self.frame_ring = ring
+        self.last_frame_seq = 0
+        self.next_ring_attempt = 0.0
+
+    def connect_frame_ring(self):
+        # While the extractor is not running, retry with exponential back-off and warn only once
+        now = time.monotonic()
+        if now < self.next_ring_attempt:
+            return False
+        extractor_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, 'Data-Extraction')
+        if extractor_dir not in sys.path:
+            sys.path.append(extractor_dir)
+        from sharedframering import SharedFrameRing
+        from radarrawdataextractor import SHARED_FRAMES_NAME
+
+        try:
+            self.frame_ring = SharedFrameRing.attach(SHARED_FRAMES_NAME)
+        except FileNotFoundError:
+            if self.ring_retry_delay == RING_RETRY_DELAY:
+                logging.warning(f"No live radar frames: shared memory '{SHARED_FRAMES_NAME}' not found, "
+                                f"retrying every {RING_MAX_RETRY_DELAY:.0f} s at most")
+            self.next_ring_attempt = now + self.ring_retry_delay
+            self.ring_retry_delay = min(2 * self.ring_retry_delay, RING_MAX_RETRY_DELAY)
+            return False
+        self.ring_retry_delay = RING_RETRY_DELAY
+        logging.info(f"Attached to live radar frames '{SHARED_FRAMES_NAME}'")
+        return True
+
+    def detect_3d_objects(self, point_cloud):
+        return detect_3d_objects(self.object_detector, point_cloud)
+
+    def check_alerts(self, detections):
+        alerts, critical_alert = classify_alerts(detections)
+
+        if alerts:
+            alert_text = "\n".join(alerts)
+            self.alert_label.setText(alert_text)
+            self.alert_label.setStyleSheet("background-color: red; color: white;")
+            logging.warning(alert_text)
+            if critical_alert:
+                self.play_alert_sound()
+        else:
+            self.alert_label.setText("No alerts")
+            self.alert_label.setStyleSheet("")
+
+    def play_alert_sound(self):
+        if self.alert_sound is None:
+            from PyQt5.QtMultimedia import QSound
+            self.alert_sound = QSound("alert.wav")
+        self.alert_sound.play()
+
+    def update_zoom(self, value):
+        self.zoom_level = value / 100.0
+        self.canvas.update()
+
+    def toggle_data_source(self, index):
+        self.use_real_data = (index == 1)
+
+    def update_timer_interval(self, value):
+        self.timer.setInterval(value)
+        self.simulator.rate_hz = 1000.0 / value
+
+    def calibrate_radar(self):
+        # Implement radar calibration process
+        calibration_file, _ = QFileDialog.getOpenFileName(self, "Select Calibration File")
+        if calibration_file:
+            # Perform calibration using the selected file
+            logging.info(f"Calibrating radar using file: {calibration_file}")
+            # Implement calibration logic here
+
+    def closeEvent(self, event):
+        if self.frame_ring is not None:
+            self.frame_ring.close()
+        super().closeEvent(event)
+
+    def open_manual_correction(self):
+        self.correction_dialog = ManualCorrectionDialog(self.radar_data, self)
+        self.correction_dialog.show()
+
+class RadarCanvas(QWidget):
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.parent = parent
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        # Apply zoom
+        painter.scale(self.parent.zoom_level, self.parent.zoom_level)
+
+        # Draw port area (simplified)
+        painter.setPen(QPen(Qt.black, 2))
+        painter.setBrush(QBrush(QColor(200, 200, 200)))
+        painter.drawRect(50, 50, 700, 500)
+
+        # Draw storage tanks (simplified)
+        tank_positions = [(200, 200), (400, 200), (600, 200)]
+        for x, y in tank_positions:
+            painter.setBrush(QBrush(QColor(150, 150, 150)))
+            painter.drawEllipse(x-30, y-30, 60, 60)
+
+        # Draw vessel (simplified)
+        painter.setBrush(QBrush(QColor(150, 150, 150)))
+        painter.drawRect(100, 400, 300, 100)
+
+        # Draw radar positions
+        for x, y in RADAR_POSITIONS:
+            painter.setPen(QPen(Qt.blue, 2))
+            painter.drawEllipse(x-5, y-5, 10, 10)
+
+        # Draw radar detections
+        painter.setPen(QPen(Qt.red, 2))
+        for i, detections in enumerate(self.parent.radar_data):
+            radar_x, radar_y = RADAR_POSITIONS[i]
+            for distance, angle in detections:
+                x = radar_x + distance * math.cos(math.radians(angle))
+                y = radar_y + distance * math.sin(math.radians(angle))
+                painter.drawLine(QPointF(radar_x, radar_y), QPointF(x, y))
+
+class ManualCorrectionDialog(QWidget):
+    def __init__(self, radar_data, parent=None):
+        super().__init__(parent)
+        self.radar_data = radar_data
+        self.initUI()
+
+    def initUI(self):
+        layout = QVBoxLayout()
+        self.setLayout(layout)
+
+        self.object_list = QListWidget()
+        layout.addWidget(self.object_list)
+
+        for i, detection in enumerate(self.radar_data):
+            self.object_list.addItem(f"Object {i+1}")
+
+        self.edit_button = QPushButton("Edit Object")
+        self.edit_button.clicked.connect(self.edit_object)
+        layout.addWidget(self.edit_button)
+
+    def edit_object(self):
+        selected_item = self.object_list.currentItem()
+        if selected_item:
+            index = self.object_list.row(selected_item)
+            # Open a dialog to edit the object's properties
+            # Implement the editing logic here
+
+if __name__ == '__main__':
+    main()
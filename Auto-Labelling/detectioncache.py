@@ -0,0 +1,133 @@
+import json
+import time
+import sqlite3
+import hashlib
+import weakref
+import numpy as np
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS detections (
+    key TEXT PRIMARY KEY,
+    box_dim INTEGER NOT NULL,
+    data BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS detections_by_access ON detections (last_access);
+CREATE TABLE IF NOT EXISTS meta (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO meta (name, value) VALUES ('total_bytes', 0);
+'''
+
+# Bytes charged per entry on top of its detections, so frames without detections still count
+ENTRY_OVERHEAD = 64
+
+def model_fingerprint(model, config=None):
+    # Hash of the weights plus any settings that change the raw detector output
+    digest = hashlib.blake2b(digest_size=16)
+    for name, tensor in model.state_dict().items():
+        digest.update(name.encode())
+        digest.update(tensor.detach().cpu().numpy().tobytes())
+    digest.update(json.dumps(config, sort_keys=True, default=str).encode())
+    return digest.hexdigest()
+
+def detection_dtype(box_dim):
+    return np.dtype([('box', np.float32, (box_dim,)), ('score', np.float64), ('label', np.int64)])
+
+class DetectionCache:
+    # Persistent cache of raw detector output keyed by the input points and the model fingerprint.
+    # SQLite handles locking, so parallel workers can share one cache file; least recently used
+    # entries are evicted once the stored detections exceed max_bytes.
+    def __init__(self, path='detection_cache.db', max_bytes=1 << 30, touch_interval=60.0):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.touch_interval = touch_interval
+        self.hits = 0
+        self.misses = 0
+        # Fingerprints of models used without an explicit one, hashed once per model
+        self.fingerprints = weakref.WeakKeyDictionary()
+        self.conn = sqlite3.connect(path, timeout=60.0, isolation_level=None)
+        self.conn.execute('PRAGMA journal_mode = WAL')
+        self.conn.execute('PRAGMA synchronous = NORMAL')
+        self.conn.executescript(SCHEMA)
+
+    def model_fingerprint(self, model):
+        if model not in self.fingerprints:
+            self.fingerprints[model] = model_fingerprint(model)
+        return self.fingerprints[model]
+
+    def key(self, points, fingerprint):
+        points = np.ascontiguousarray(points)
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(fingerprint.encode())
+        digest.update(f'{points.dtype.str}{points.shape}'.encode())
+        digest.update(memoryview(points).cast('B'))
+        return digest.hexdigest()
+
+    def get(self, key):
+        row = self.conn.execute('SELECT box_dim, data, last_access FROM detections WHERE key = ?', (key,)).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        box_dim, data, last_access = row
+
+        # Refresh the LRU timestamp at most once per touch_interval to keep hits read-only
+        now = time.time()
+        if now - last_access > self.touch_interval:
+            self.conn.execute('UPDATE detections SET last_access = ? WHERE key = ?', (now, key))
+
+        records = np.frombuffer(data, dtype=detection_dtype(box_dim))
+        return [{'box': record['box'].copy(), 'score': float(record['score']), 'label': int(record['label'])}
+                for record in records]
+
+    def put(self, key, detections):
+        box_dim = len(detections[0]['box']) if detections else 0
+        records = np.empty(len(detections), dtype=detection_dtype(box_dim))
+        if detections:
+            records['box'] = np.stack([detection['box'] for detection in detections])
+            records['score'] = [detection['score'] for detection in detections]
+            records['label'] = [detection['label'] for detection in detections]
+        data = records.tobytes()
+        size = len(data) + ENTRY_OVERHEAD
+
+        self.conn.execute('BEGIN IMMEDIATE')
+        try:
+            row = self.conn.execute('SELECT size FROM detections WHERE key = ?', (key,)).fetchone()
+            previous_size = row[0] if row else 0
+            self.conn.execute('INSERT OR REPLACE INTO detections (key, box_dim, data, size, last_access) '
+                              'VALUES (?, ?, ?, ?, ?)', (key, box_dim, data, size, time.time()))
+            self.conn.execute("UPDATE meta SET value = value + ? WHERE name = 'total_bytes'",
+                              (size - previous_size,))
+            self.evict()
+            self.conn.execute('COMMIT')
+        except BaseException:
+            self.conn.execute('ROLLBACK')
+            raise
+
+    def evict(self):
+        # Drop the least recently used entries until the cache is back under 90% of max_bytes
+        total = self.total_bytes
+        if total <= self.max_bytes:
+            return
+        target = int(self.max_bytes * 0.9)
+        evicted_keys = []
+        for key, size in self.conn.execute('SELECT key, size FROM detections ORDER BY last_access'):
+            if total <= target:
+                break
+            evicted_keys.append((key,))
+            total -= size
+        self.conn.executemany('DELETE FROM detections WHERE key = ?', evicted_keys)
+        self.conn.execute("UPDATE meta SET value = ? WHERE name = 'total_bytes'", (total,))
+
+    @property
+    def total_bytes(self):
+        return self.conn.execute("SELECT value FROM meta WHERE name = 'total_bytes'").fetchone()[0]
+
+    def __len__(self):
+        return self.conn.execute('SELECT COUNT(*) FROM detections').fetchone()[0]
+
+    def close(self):
+        self.conn.close()
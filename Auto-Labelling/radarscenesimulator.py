@@ -0,0 +1,175 @@
+import sys
+import time
+import numpy as np
+
+# Radar positions around the port, in the same scene units the RadarCanvas draws in
+RADAR_POSITIONS = [
+    (100, 100), (700, 100), (400, 300),
+    (100, 500), (700, 500), (250, 300), (550, 300)
+]
+# Port area (x_min, y_min, x_max, y_max)
+SCENE_BOUNDS = (50, 50, 750, 550)
+MOTION_MODELS = ('constant_velocity', 'random_walk', 'static')
+
+class RadarSceneSimulator:
+    def __init__(self, num_targets=10, radar_positions=RADAR_POSITIONS, bounds=SCENE_BOUNDS,
+                 motion_model='random_walk', rate_hz=1.0, max_range=300.0, detection_probability=0.9,
+                 range_noise=1.0, angle_noise=0.5, clutter_rate=2.0, max_speed=5.0, acceleration_noise=1.0,
+                 points_per_target=8, point_spread=0.5, seed=None):
+        if motion_model not in MOTION_MODELS:
+            raise ValueError(f"Unknown motion model {motion_model!r}, expected one of {MOTION_MODELS}")
+        if rate_hz <= 0:
+            raise ValueError("rate_hz must be positive")
+
+        self.radar_positions = np.asarray(radar_positions, dtype=np.float64).reshape(-1, 2)
+        self.bounds = np.asarray(bounds, dtype=np.float64)
+        self.motion_model = motion_model
+        self.rate_hz = rate_hz
+        self.max_range = max_range
+        self.detection_probability = detection_probability
+        self.range_noise = range_noise
+        self.angle_noise = angle_noise
+        self.clutter_rate = clutter_rate
+        self.max_speed = max_speed
+        self.acceleration_noise = acceleration_noise
+        self.points_per_target = points_per_target
+        self.point_spread = point_spread
+        self.rng = np.random.default_rng(seed)
+        self.frame_index = 0
+        self.reset_targets(num_targets)
+
+    @property
+    def num_radars(self):
+        return len(self.radar_positions)
+
+    @property
+    def num_targets(self):
+        return len(self.positions)
+
+    def reset_targets(self, num_targets):
+        low, high = self.bounds[:2], self.bounds[2:]
+        self.positions = self.rng.uniform(low, high, size=(num_targets, 2))
+        headings = self.rng.uniform(0, 2 * np.pi, num_targets)
+        speeds = self.rng.uniform(0, self.max_speed, num_targets)
+        self.velocities = np.stack([np.cos(headings), np.sin(headings)], axis=1) * speeds[:, None]
+        # Person-to-vehicle sized targets: height in scene units and radar cross-section in [0.2, 1]
+        self.heights = self.rng.uniform(1.5, 4.0, num_targets)
+        self.rcs = self.rng.uniform(0.2, 1.0, num_targets)
+
+    def move_targets(self, dt):
+        if self.motion_model == 'static' or self.num_targets == 0:
+            return
+        if self.motion_model == 'random_walk':
+            self.velocities += self.rng.normal(0, self.acceleration_noise * np.sqrt(dt), self.velocities.shape)
+            speeds = np.linalg.norm(self.velocities, axis=1, keepdims=True)
+            self.velocities *= np.minimum(1.0, self.max_speed / np.maximum(speeds, 1e-9))
+        self.positions += self.velocities * dt
+
+        # Reflect targets that leave the port area back inside
+        low, high = self.bounds[:2], self.bounds[2:]
+        below, above = self.positions < low, self.positions > high
+        self.positions = np.where(below, 2 * low - self.positions, self.positions)
+        self.positions = np.where(above, 2 * high - self.positions, self.positions)
+        self.velocities[below | above] *= -1
+        np.clip(self.positions, low, high, out=self.positions)
+
+    def observe(self):
+        # Target returns: every (radar, target) pair in range, thinned by the detection probability
+        offsets = self.positions[None, :, :] - self.radar_positions[:, None, :]
+        distances = np.hypot(offsets[..., 0], offsets[..., 1])
+        angles = np.degrees(np.arctan2(offsets[..., 1], offsets[..., 0]))
+        detected = (distances <= self.max_range) & (self.rng.random(distances.shape) < self.detection_probability)
+        radar_idx, target_idx = np.nonzero(detected)
+
+        target_distances = distances[radar_idx, target_idx] + self.rng.normal(0, self.range_noise, len(radar_idx))
+        target_angles = angles[radar_idx, target_idx] + self.rng.normal(0, self.angle_noise, len(radar_idx))
+
+        # Clutter: Poisson-distributed false returns per radar, uniform over its coverage
+        clutter_counts = self.rng.poisson(self.clutter_rate, self.num_radars)
+        clutter_radar_idx = np.repeat(np.arange(self.num_radars), clutter_counts)
+        num_clutter = len(clutter_radar_idx)
+        clutter_distances = self.max_range * np.sqrt(self.rng.random(num_clutter))
+        clutter_angles = self.rng.uniform(0, 360, num_clutter)
+
+        radar_idx = np.concatenate([radar_idx, clutter_radar_idx])
+        distances = np.abs(np.concatenate([target_distances, clutter_distances]))
+        angles = np.concatenate([target_angles, clutter_angles]) % 360
+        heights = np.concatenate([self.heights[target_idx], np.full(num_clutter, 0.5)])
+        rcs = np.concatenate([self.rcs[target_idx], self.rng.uniform(0.0, 0.3, num_clutter)])
+        points_per_return = np.concatenate([np.full(len(target_idx), self.points_per_target),
+                                            np.ones(num_clutter, dtype=int)])
+
+        order = np.argsort(radar_idx, kind='stable')
+        radar_idx, distances, angles = radar_idx[order], distances[order], angles[order]
+        heights, rcs, points_per_return = heights[order], rcs[order], points_per_return[order]
+        return radar_idx, distances, angles, heights, rcs, points_per_return
+
+    def to_point_cloud(self, radar_idx, distances, angles, heights, rcs, points_per_return):
+        # Spread each return into a small cluster of (x, y, z, intensity) points in scene coordinates
+        counts = np.maximum(self.rng.poisson(points_per_return), 1)
+        point_idx = np.repeat(np.arange(len(distances)), counts)
+        radians = np.radians(angles[point_idx])
+        origins = self.radar_positions[radar_idx[point_idx]]
+
+        points = np.empty((len(point_idx), 4), dtype=np.float32)
+        points[:, 0] = origins[:, 0] + distances[point_idx] * np.cos(radians)
+        points[:, 1] = origins[:, 1] + distances[point_idx] * np.sin(radians)
+        points[:, :2] += self.rng.normal(0, self.point_spread, (len(point_idx), 2))
+        points[:, 2] = self.rng.uniform(0, heights[point_idx])
+        attenuation = 1.0 + (distances[point_idx] / self.max_range) ** 2
+        points[:, 3] = np.clip(rcs[point_idx] / attenuation + self.rng.normal(0, 0.02, len(point_idx)), 0, 1)
+        return points, np.repeat(radar_idx, counts)
+
+    def step(self):
+        dt = 1.0 / self.rate_hz
+        if self.frame_index > 0:
+            self.move_targets(dt)
+
+        radar_idx, distances, angles, heights, rcs, points_per_return = self.observe()
+        points, point_radar_idx = self.to_point_cloud(radar_idx, distances, angles, heights, rcs, points_per_return)
+
+        # Split the flat arrays into one array per radar, matching RadarAlert.radar_data
+        split_at = np.cumsum(np.bincount(radar_idx, minlength=self.num_radars))[:-1]
+        polar = np.stack([distances, angles], axis=1)
+        point_split_at = np.cumsum(np.bincount(point_radar_idx, minlength=self.num_radars))[:-1]
+
+        frame = {
+            'frame_index': self.frame_index,
+            'timestamp': self.frame_index * dt,
+            'polar': np.split(polar, split_at),
+            'point_cloud': np.split(points, point_split_at),
+            'targets': self.positions.copy(),
+        }
+        self.frame_index += 1
+        return frame
+
+    def stream(self, num_frames=None, realtime=False):
+        # Yield frames at rate_hz; with realtime=False frames are produced as fast as possible
+        next_time = time.perf_counter()
+        produced = 0
+        while num_frames is None or produced < num_frames:
+            if realtime:
+                delay = next_time - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                next_time += 1.0 / self.rate_hz
+            yield self.step()
+            produced += 1
+
+def main():
+    # Load test: report how many frames and points per second the simulator sustains
+    num_targets = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    num_frames = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+
+    simulator = RadarSceneSimulator(num_targets=num_targets, rate_hz=20.0, seed=0)
+    num_points = 0
+    start = time.perf_counter()
+    for frame in simulator.stream(num_frames):
+        num_points += sum(len(points) for points in frame['point_cloud'])
+    elapsed = time.perf_counter() - start
+
+    print(f"Targets: {num_targets}, radars: {simulator.num_radars}, frames: {num_frames}")
+    print(f"{num_frames / elapsed:.1f} frames/s, {num_points / elapsed:.0f} points/s")
+
+if __name__ == '__main__':
+    main()
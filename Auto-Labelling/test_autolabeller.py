@@ -0,0 +1,31 @@
+import numpy as np
+
+import autolabeller
+from autolabeller import DataAugmentation, autolabel_frame
+from detectioncache import DetectionCache
+
+def fake_detector(model, points):
+    # One box around the first point, scored by its coordinates so augmented passes differ
+    model.calls += 1
+    box = np.array([*points[0, :3], 1.0, 1.0, 1.0, 0.0], dtype=np.float32)
+    return [{'box': box, 'score': float(np.abs(points[:, :3]).mean() % 1.0), 'label': 1}]
+
+class CountingModel:
+    calls = 0
+
+def test_unchanged_frame_with_passes_skips_inference(tmp_path, monkeypatch):
+    monkeypatch.setattr(autolabeller, 'run_detector', fake_detector)
+    points = np.random.default_rng(0).uniform(-10, 10, (64, 4)).astype(np.float32)
+    model = CountingModel()
+    cache = DetectionCache(str(tmp_path / 'cache.db'))
+
+    first = autolabel_frame(model, points, DataAugmentation(), num_passes=4, cache=cache, fingerprint='model')
+    # A pass that applies no augmentation repeats the original points and is already a cache hit
+    assert 1 < model.calls <= 5
+
+    model.calls = 0
+    second = autolabel_frame(model, points, DataAugmentation(), num_passes=4, cache=cache, fingerprint='model')
+    assert model.calls == 0
+    for a, b in zip(first, second):
+        np.testing.assert_array_equal(a, b)
+    cache.close()
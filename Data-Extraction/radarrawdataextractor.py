@@ -1,10 +1,11 @@
 import numpy as np
-import matplotlib.pyplot as plt
-from rtlsdr import RtlSdr
-import h5py
 import logging
 from multiprocessing import Process, Queue
 import time
+from sharedframering import SharedFrameRing
+
+# Name of the shared memory ring RadarAlert reads live frames from
+SHARED_FRAMES_NAME = 'radar_frames'
 
 class RadarDataExtractor:
     def __init__(self, center_freq, sample_rate, num_samples, num_channels=1, output_file='radar_data.h5'):
@@ -13,6 +14,8 @@ class RadarDataExtractor:
         self.num_samples = num_samples
         self.num_channels = num_channels
         self.output_file = output_file
+        # Hardware, plotting and HDF5 libraries are imported where they are used
+        from rtlsdr import RtlSdr
         self.sdr = RtlSdr()
         self.setup_logging()
 
@@ -56,6 +59,7 @@ class RadarDataExtractor:
         return processed_samples
 
     def plot_data(self, samples):
+        import matplotlib.pyplot as plt
         plt.figure(figsize=(12, 6))
         plt.subplot(2, 1, 1)
         plt.plot(np.real(samples))
@@ -67,6 +71,7 @@ class RadarDataExtractor:
         plt.show()
 
     def save_data(self, samples):
+        import h5py
         try:
             with h5py.File(self.output_file, 'w') as f:
                 f.create_dataset('radar_samples', data=samples)
@@ -98,6 +103,32 @@ class RadarDataExtractor:
         process.start()
         return queue, process
 
+    def run_real_time_shared(self, ring_name, max_lag=None):
+        # Publish every processed capture into the shared memory ring; the capture time is taken
+        # as soon as the samples arrive so readers can measure end-to-end latency
+        ring = SharedFrameRing.attach(ring_name, untrack=False)
+        try:
+            self.setup_sdr()
+            while True:
+                raw_samples = self.capture_samples()
+                capture_time = time.monotonic()
+                processed_samples = self.process_samples(raw_samples)
+                ring.publish(processed_samples, capture_time, max_lag=max_lag)
+        except Exception as e:
+            logging.error(f'Error in shared memory real-time operation: {e}')
+        finally:
+            logging.info(f'Shared memory ring dropped {ring.dropped} unread frames')
+            ring.close()
+            self.close()
+
+    def start_shared_memory(self, ring_name=SHARED_FRAMES_NAME, num_slots=4, max_lag=None):
+        # Unlike start_real_time, frames are not pickled: the reader gets a view of the newest
+        # frame in shared memory. The caller owns the returned ring and must close it.
+        ring = SharedFrameRing.create(ring_name, (self.num_samples,), np.complex64, num_slots)
+        process = Process(target=self.run_real_time_shared, args=(ring_name, max_lag))
+        process.start()
+        return ring, process
+
     def synchronize_with_radar(self):
         # Placeholder for synchronization logic
         logging.info('Synchronizing with radar control system')
@@ -114,6 +145,7 @@ if __name__ == "__main__":
 
     # Create extractor instance
     extractor = RadarDataExtractor(CENTER_FREQ, SAMPLE_RATE, NUM_SAMPLES, NUM_CHANNELS, OUTPUT_FILE)
+    ring = process = None
 
     try:
         # Extract raw data
@@ -128,16 +160,18 @@ if __name__ == "__main__":
         # Save the data
         extractor.save_data(raw_data)
 
-        # Start real-time data streaming
-        queue, process = extractor.start_real_time()
-        while True:
-            if not queue.empty():
-                real_time_data = queue.get()
-                print(f"Real-time data shape: {real_time_data.shape}")
-                # Process real-time data as needed
-                # For example, plot or save real-time data
+        # Stream frames over shared memory. RadarAlert attaches to the ring by name, so this process
+        # keeps the ring open for as long as the capture process runs.
+        ring, process = extractor.start_shared_memory()
+        while process.is_alive():
+            time.sleep(1)
+            print(f"Published {ring.latest_seq} frames, {ring.dropped} dropped")
 
     finally:
-        # Always close the SDR device
+        # Always close the SDR device, then stop the capture process before removing the ring
         extractor.close()
-        process.terminate()
+        if process is not None:
+            process.terminate()
+            process.join()
+        if ring is not None:
+            ring.close()
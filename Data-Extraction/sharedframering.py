@@ -0,0 +1,172 @@
+import os
+import sys
+import time
+import fcntl
+import tempfile
+import numpy as np
+from contextlib import contextmanager
+from multiprocessing import shared_memory, resource_tracker
+
+# Ring layout in one shared memory block:
+#   header  int64[HEADER_FIELDS]  latest_seq, latest_slot, pinned_slot, read_seq, dropped,
+#                                 generation, num_slots, dtype_char, ndim, shape[MAX_DIMS]
+#   slots   int64[num_slots]      sequence number of the frame in each slot, 0 while being written
+#   times   float64[num_slots]    capture time (time.monotonic) of the frame in each slot
+#   data    dtype[num_slots, *frame_shape]
+LATEST_SEQ, LATEST_SLOT, PINNED_SLOT, READ_SEQ, DROPPED, GENERATION, NUM_SLOTS, DTYPE_CHAR, NDIM, SHAPE = range(10)
+MAX_DIMS = 4
+HEADER_FIELDS = SHAPE + MAX_DIMS
+NO_SLOT = -1
+
+class SharedFrameRing:
+    # Single-producer, single-consumer ring of fixed-shape frames with latest-frame semantics.
+    # The consumer pins the slot it is reading, so the producer never overwrites a frame that
+    # is still in use and the consumer can work on a view of shared memory without copying.
+    # Pinning and claiming a slot take a file lock next to the block, which also orders the
+    # frame data between the two processes.
+    def __init__(self, shm, owner):
+        self.shm = shm
+        self.owner = owner
+        self.lock_path = os.path.join(tempfile.gettempdir(), f'{shm.name.lstrip("/")}.lock')
+        self.lock_file = open(self.lock_path, 'a')
+        self.pinned = False
+        self.header = np.ndarray((HEADER_FIELDS,), dtype=np.int64, buffer=shm.buf)
+        num_slots = int(self.header[NUM_SLOTS])
+        self.dtype = np.dtype(chr(self.header[DTYPE_CHAR]))
+        self.frame_shape = tuple(int(n) for n in self.header[SHAPE:SHAPE + self.header[NDIM]])
+
+        offset = self.header.nbytes
+        self.slot_seq = np.ndarray((num_slots,), dtype=np.int64, buffer=shm.buf, offset=offset)
+        offset += self.slot_seq.nbytes
+        self.slot_time = np.ndarray((num_slots,), dtype=np.float64, buffer=shm.buf, offset=offset)
+        offset += self.slot_time.nbytes
+        offset += -offset % self.dtype.alignment
+        self.data = np.ndarray((num_slots,) + self.frame_shape, dtype=self.dtype, buffer=shm.buf, offset=offset)
+        self.next_slot = 0
+
+    @classmethod
+    def create(cls, name, frame_shape, dtype, num_slots=4):
+        if num_slots < 3:
+            raise ValueError("num_slots must be at least 3: one pinned, one latest and one being written")
+        frame_shape = tuple(frame_shape)
+        if len(frame_shape) > MAX_DIMS:
+            raise ValueError(f"Frames can have at most {MAX_DIMS} dimensions")
+        dtype = np.dtype(dtype)
+        size = (HEADER_FIELDS + 2 * num_slots) * 8 + dtype.alignment
+        size += num_slots * int(np.prod(frame_shape, dtype=np.int64)) * dtype.itemsize
+
+        shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        header = np.ndarray((HEADER_FIELDS,), dtype=np.int64, buffer=shm.buf)
+        header[:] = 0
+        header[LATEST_SLOT] = header[PINNED_SLOT] = NO_SLOT
+        # Identifies this block, so readers can tell a restarted producer's ring from the old one
+        header[GENERATION] = int.from_bytes(os.urandom(8), 'little') >> 1
+        header[NUM_SLOTS] = num_slots
+        header[DTYPE_CHAR] = ord(dtype.char)
+        header[NDIM] = len(frame_shape)
+        header[SHAPE:SHAPE + len(frame_shape)] = frame_shape
+        del header
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name, untrack=True):
+        # Only the creator may unlink the block, so unrelated processes stop their resource tracker
+        # from removing it at exit. Processes started by the creator through multiprocessing share
+        # its tracker and should pass untrack=False.
+        if sys.version_info >= (3, 13):
+            shm = shared_memory.SharedMemory(name=name, track=not untrack)
+        else:
+            shm = shared_memory.SharedMemory(name=name)
+            if untrack:
+                resource_tracker.unregister(shm._name, 'shared_memory')
+        return cls(shm, owner=False)
+
+    @property
+    def num_slots(self):
+        return len(self.slot_seq)
+
+    @property
+    def generation(self):
+        return int(self.header[GENERATION])
+
+    @property
+    def latest_seq(self):
+        return int(self.header[LATEST_SEQ])
+
+    @property
+    def dropped(self):
+        return int(self.header[DROPPED])
+
+    def publish(self, frame, capture_time=None, max_lag=None, timeout=None):
+        # With max_lag set, wait until the consumer is less than max_lag frames behind (backpressure);
+        # after timeout the frame is published anyway and unread frames count as dropped
+        if capture_time is None:
+            capture_time = time.monotonic()
+        if max_lag is not None:
+            deadline = None if timeout is None else time.monotonic() + timeout
+            while self.header[LATEST_SEQ] - self.header[READ_SEQ] >= max_lag:
+                if deadline is not None and time.monotonic() > deadline:
+                    break
+                time.sleep(0.0002)
+
+        slot = self.claim_slot()
+        self.data[slot] = frame
+        self.slot_time[slot] = capture_time
+        with self.locked():
+            seq = int(self.header[LATEST_SEQ]) + 1
+            self.slot_seq[slot] = seq
+            if self.header[LATEST_SEQ] > self.header[READ_SEQ]:
+                self.header[DROPPED] += 1
+            self.header[LATEST_SLOT] = slot
+            self.header[LATEST_SEQ] = seq
+        return seq
+
+    def claim_slot(self):
+        # Round-robin over the slots that are neither the latest frame nor pinned by the consumer
+        with self.locked():
+            while True:
+                slot = self.next_slot
+                self.next_slot = (slot + 1) % self.num_slots
+                if slot != self.header[LATEST_SLOT] and slot != self.header[PINNED_SLOT]:
+                    self.slot_seq[slot] = 0
+                    return slot
+
+    def read_latest(self, last_seq=0):
+        # Returns (seq, capture_time, frame) for the newest frame, or None if nothing newer than
+        # last_seq has been published. frame is a read-only view into shared memory that stays
+        # valid until the next call to read_latest.
+        with self.locked():
+            seq = int(self.header[LATEST_SEQ])
+            if seq <= last_seq:
+                return None
+            slot = int(self.header[LATEST_SLOT])
+            self.header[PINNED_SLOT] = slot
+            self.header[READ_SEQ] = seq
+            self.pinned = True
+        frame = self.data[slot]
+        frame.flags.writeable = False
+        return seq, float(self.slot_time[slot]), frame
+
+    def is_current(self, seq):
+        # True while the pinned frame with this sequence number has not been overwritten
+        slot = int(self.header[PINNED_SLOT])
+        return slot != NO_SLOT and self.slot_seq[slot] == seq
+
+    @contextmanager
+    def locked(self):
+        fcntl.flock(self.lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(self.lock_file, fcntl.LOCK_UN)
+
+    def close(self):
+        if self.pinned:
+            with self.locked():
+                self.header[PINNED_SLOT] = NO_SLOT
+        del self.header, self.slot_seq, self.slot_time, self.data
+        self.shm.close()
+        self.lock_file.close()
+        if self.owner:
+            self.shm.unlink()
+            os.remove(self.lock_path)
@@ -0,0 +1,288 @@
+import numpy as np
+import open3d as o3d
+from PyQt5.QtWidgets import (QMainWindow, QVBoxLayout, QHBoxLayout, QWidget, QPushButton, QComboBox, QShortcut,
+                             QCheckBox, QLabel, QLineEdit, QFileDialog, QSlider, QColorDialog, QListWidget)
+from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtGui import QKeySequence
+
+from radardatavisualization import (load_point_cloud, load_labels, label_statistics, encode_labels, label_palette,
+                                    label_colors, main)
+
+class RadarPointCloudVisualizer(QMainWindow):
+    def __init__(self, point_cloud_path, manual_labels_path, auto_labels_path):
+        super().__init__()
+        self.point_cloud = self.load_point_cloud(point_cloud_path)
+        self.manual_labels = self.load_labels(manual_labels_path)
+        self.auto_labels = self.load_labels(auto_labels_path)
+        self.label_names, self.manual_codes, self.auto_codes = encode_labels(self.manual_labels, self.auto_labels)
+        self.palette = label_palette(len(self.label_names))
+        self.differences = self.manual_codes != self.auto_codes
+        self.current_view = 'manual'
+        self.side_by_side = False
+        self.show_differences = False
+        self.filtered_labels = set()
+        self.point_size = 1
+        self.background_color = [0.1, 0.1, 0.1]
+        self.init_ui()
+
+    def load_point_cloud(self, path):
+        return load_point_cloud(path)
+
+    def load_labels(self, path):
+        return load_labels(path)
+
+    def init_ui(self):
+        self.setWindowTitle('Radar Point Cloud Visualizer')
+        self.setGeometry(100, 100, 1200, 800)
+
+        main_widget = QWidget()
+        self.setCentralWidget(main_widget)
+
+        layout = QHBoxLayout()
+        main_widget.setLayout(layout)
+
+        # Control panel
+        control_layout = QVBoxLayout()
+        layout.addLayout(control_layout, 1)
+
+        self.view_selector = QComboBox()
+        self.view_selector.addItems(['Manual Labels', 'Auto Labels', 'Side-by-Side'])
+        self.view_selector.currentTextChanged.connect(self.change_view)
+        control_layout.addWidget(self.view_selector)
+
+        self.diff_checkbox = QCheckBox('Show Differences')
+        self.diff_checkbox.stateChanged.connect(self.toggle_differences)
+        control_layout.addWidget(self.diff_checkbox)
+
+        # Label filter
+        self.label_filter = QComboBox()
+        self.label_filter.addItems(['All Labels'] + list(set(self.manual_labels) | set(self.auto_labels)))
+        self.label_filter.currentTextChanged.connect(self.filter_labels)
+        control_layout.addWidget(self.label_filter)
+
+        # Search function
+        self.search_input = QLineEdit()
+        self.search_input.setPlaceholderText("Search labels or coordinates")
+        self.search_button = QPushButton("Search")
+        self.search_button.clicked.connect(self.search_points)
+        control_layout.addWidget(self.search_input)
+        control_layout.addWidget(self.search_button)
+
+        # Screenshot and export buttons
+        self.screenshot_button = QPushButton("Take Screenshot")
+        self.screenshot_button.clicked.connect(self.take_screenshot)
+        control_layout.addWidget(self.screenshot_button)
+
+        self.export_button = QPushButton("Export Labeled Point Cloud")
+        self.export_button.clicked.connect(self.export_point_cloud)
+        control_layout.addWidget(self.export_button)
+
+        # Point size control
+        self.point_size_slider = QSlider(Qt.Horizontal)
+        self.point_size_slider.setMinimum(1)
+        self.point_size_slider.setMaximum(10)
+        self.point_size_slider.setValue(self.point_size)
+        self.point_size_slider.valueChanged.connect(self.change_point_size)
+        control_layout.addWidget(QLabel("Point Size:"))
+        control_layout.addWidget(self.point_size_slider)
+
+        # Background color control
+        self.bg_color_button = QPushButton("Change Background Color")
+        self.bg_color_button.clicked.connect(self.change_background_color)
+        control_layout.addWidget(self.bg_color_button)
+
+        self.label_info = QLabel('Label Info: ')
+        control_layout.addWidget(self.label_info)
+
+        # Legend
+        self.legend = QListWidget()
+        control_layout.addWidget(QLabel("Legend:"))
+        control_layout.addWidget(self.legend)
+
+        # Point cloud visualization
+        self.vis_layout = QHBoxLayout()
+        layout.addLayout(self.vis_layout, 3)
+
+        self.vis = o3d.visualization.Visualizer()
+        self.vis.create_window()
+        self.vis.add_geometry(self.point_cloud)
+
+        self.vis_widget = QWidget.createWindowContainer(self.vis.get_render_window())
+        self.vis_layout.addWidget(self.vis_widget)
+
+        # Side-by-side view (initially hidden). Open3D copies the coordinates on assignment, so this
+        # pane holds its own copy. The legacy Visualizer re-uploads the whole geometry on every
+        # update_geometry call, so recolouring is not a colour-only upload.
+        self.point_cloud2 = o3d.geometry.PointCloud()
+        self.point_cloud2.points = self.point_cloud.points
+        self.vis2 = o3d.visualization.Visualizer()
+        self.vis2.create_window()
+        self.vis2.add_geometry(self.point_cloud2)
+        self.vis2_widget = QWidget.createWindowContainer(self.vis2.get_render_window())
+        self.vis2_widget.hide()
+        self.vis_layout.addWidget(self.vis2_widget)
+
+        # Colour state last uploaded to each pane, so panes whose colours did not change are skipped
+        self.pane_color_state = [None, None]
+        self.synced_extrinsic = None
+        self.render_timer = QTimer(self)
+        self.render_timer.timeout.connect(self.render_panes)
+        self.render_timer.start(30)
+
+        self.update_point_cloud_colors()
+        self.update_label_info()
+        self.setup_shortcuts()
+
+    def setup_shortcuts(self):
+        QShortcut(QKeySequence("Ctrl+S"), self, self.take_screenshot)
+        QShortcut(QKeySequence("Ctrl+E"), self, self.export_point_cloud)
+        QShortcut(QKeySequence("Ctrl+F"), self, self.search_input.setFocus)
+        QShortcut(QKeySequence("Ctrl+D"), self, self.toggle_differences)
+
+    def change_view(self, view):
+        if view == 'Side-by-Side':
+            self.side_by_side = True
+            self.vis2_widget.show()
+            self.synced_extrinsic = None
+            self.sync_cameras()
+        else:
+            self.side_by_side = False
+            self.vis2_widget.hide()
+            self.current_view = 'manual' if view == 'Manual Labels' else 'auto'
+        self.refresh_colors()
+
+    def toggle_differences(self, state):
+        self.show_differences = state == Qt.Checked
+        self.refresh_colors()
+
+    def filter_labels(self, label):
+        if label == 'All Labels':
+            self.filtered_labels = set()
+        else:
+            self.filtered_labels = {label}
+        self.refresh_colors()
+
+    def refresh_colors(self):
+        self.update_point_cloud_colors(self.vis)
+        if self.side_by_side:
+            self.update_point_cloud_colors(self.vis2)
+
+    def render_panes(self):
+        self.vis.poll_events()
+        if self.side_by_side:
+            self.vis2.poll_events()
+            self.sync_cameras()
+
+    def sync_cameras(self):
+        # Copy the camera of whichever pane moved since the last sync onto the other pane
+        controls = [self.vis.get_view_control(), self.vis2.get_view_control()]
+        params = [control.convert_to_pinhole_camera_parameters() for control in controls]
+        source = 0
+        if self.synced_extrinsic is not None and np.allclose(params[0].extrinsic, self.synced_extrinsic):
+            source = 1
+        target = 1 - source
+        if not np.allclose(params[source].extrinsic, params[target].extrinsic):
+            controls[target].convert_from_pinhole_camera_parameters(params[source])
+            (self.vis2 if target else self.vis).update_renderer()
+        self.synced_extrinsic = params[source].extrinsic
+
+    def search_points(self):
+        query = self.search_input.text().lower()
+        matching_indices = []
+        for i, (point, manual_label, auto_label) in enumerate(zip(self.point_cloud.points, self.manual_labels, self.auto_labels)):
+            if (query in manual_label.lower() or query in auto_label.lower() or
+                query in f"{point[0]:.2f},{point[1]:.2f},{point[2]:.2f}"):
+                matching_indices.append(i)
+        
+        if matching_indices:
+            # Highlight matching points
+            colors = np.asarray(self.point_cloud.colors)
+            colors[matching_indices] = [1, 1, 0]  # Yellow for matching points
+            self.point_cloud.colors = o3d.utility.Vector3dVector(colors)
+            self.vis.update_geometry(self.point_cloud)
+            self.vis.poll_events()
+            self.vis.update_renderer()
+            self.pane_color_state[0] = None
+            
+            # Reset colors after 3 seconds
+            QTimer.singleShot(3000, self.update_point_cloud_colors)
+
+    def take_screenshot(self):
+        file_name, _ = QFileDialog.getSaveFileName(self, "Save Screenshot", "", "PNG Files (*.png)")
+        if file_name:
+            self.vis.capture_screen_image(file_name)
+
+    def export_point_cloud(self):
+        file_name, _ = QFileDialog.getSaveFileName(self, "Export Point Cloud", "", "PCD Files (*.pcd)")
+        if file_name:
+            o3d.io.write_point_cloud(file_name, self.point_cloud)
+
+    def change_point_size(self, size):
+        self.point_size = size
+        self.vis.get_render_option().point_size = self.point_size
+        self.vis2.get_render_option().point_size = self.point_size
+        self.vis.update_renderer()
+        self.vis2.update_renderer()
+
+    def change_background_color(self):
+        color = QColorDialog.getColor()
+        if color.isValid():
+            self.background_color = [color.redF(), color.greenF(), color.blueF()]
+            self.vis.get_render_option().background_color = self.background_color
+            self.vis2.get_render_option().background_color = self.background_color
+            self.vis.update_renderer()
+            self.vis2.update_renderer()
+
+    def update_point_cloud_colors(self, visualizer=None):
+        if visualizer is None:
+            visualizer = self.vis
+
+        # The left pane follows the selected view; in side-by-side mode it shows manual labels
+        # and the right pane shows auto labels
+        pane = 1 if visualizer is self.vis2 else 0
+        if pane == 1:
+            view = 'auto'
+        elif self.side_by_side:
+            view = 'manual'
+        else:
+            view = self.current_view
+
+        state = (view, self.show_differences, frozenset(self.filtered_labels))
+        if self.pane_color_state[pane] == state:
+            return
+
+        visible = None
+        if self.filtered_labels:
+            kept = np.isin(self.label_names, list(self.filtered_labels))
+            visible = kept[self.manual_codes] | kept[self.auto_codes]
+        differences = self.differences if self.show_differences else None
+        label_codes = self.manual_codes if view == 'manual' else self.auto_codes
+        colors = label_colors(label_codes, self.palette, differences, visible)
+
+        geometry = self.point_cloud2 if pane == 1 else self.point_cloud
+        geometry.colors = o3d.utility.Vector3dVector(colors)
+        visualizer.update_geometry(geometry)
+        visualizer.poll_events()
+        visualizer.update_renderer()
+        self.pane_color_state[pane] = state
+
+    def update_label_info(self):
+        manual_label_counts, auto_label_counts, diff_count = label_statistics(self.manual_labels, self.auto_labels)
+        
+        info_text = f"Manual Labels: {manual_label_counts}\n"
+        info_text += f"Auto Labels: {auto_label_counts}\n"
+        info_text += f"Differences: {diff_count}"
+        self.label_info.setText(info_text)
+
+        # Update legend
+        self.legend.clear()
+        for label, color in zip(self.label_names, self.palette):
+            self.legend.addItem(f"{label}: RGB({color[0]:.2f}, {color[1]:.2f}, {color[2]:.2f})")
+
+    def closeEvent(self, event):
+        self.render_timer.stop()
+        self.vis.destroy_window()
+        self.vis2.destroy_window()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,326 @@
+import os
+import json
+import time
+import sqlite3
+import logging
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+UNLABELED = 'Unlabeled'
+# Label files kept next to each point cloud by the manual labeller and the autolabeller
+MANUAL_LABELS_SUFFIX = '_manual_labels.txt'
+AUTO_LABELS_SUFFIX = '_auto_labels.txt'
+FRAME_EXTENSIONS = ('.pcd',)
+RECORDING_EXTENSIONS = ('.h5',)
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS recordings (
+    path TEXT PRIMARY KEY,
+    signature TEXT NOT NULL,
+    dataset TEXT,
+    num_samples INTEGER,
+    dtype TEXT,
+    data_offset INTEGER,
+    scanned_at REAL
+);
+CREATE TABLE IF NOT EXISTS frames (
+    path TEXT PRIMARY KEY,
+    signature TEXT NOT NULL,
+    directory TEXT NOT NULL,
+    num_points INTEGER,
+    fields TEXT,
+    data_format TEXT,
+    data_offset INTEGER,
+    manual_status TEXT NOT NULL,
+    has_auto_labels INTEGER NOT NULL,
+    manual_labels_path TEXT,
+    auto_labels_path TEXT,
+    scanned_at REAL
+);
+CREATE TABLE IF NOT EXISTS label_counts (
+    frame TEXT NOT NULL REFERENCES frames(path) ON DELETE CASCADE,
+    source TEXT NOT NULL,
+    label TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (frame, source, label)
+);
+CREATE INDEX IF NOT EXISTS label_counts_by_label ON label_counts (source, label, count);
+CREATE INDEX IF NOT EXISTS frames_by_status ON frames (manual_status, has_auto_labels);
+'''
+
+def file_signature(path):
+    # (mtime, size) identifies a file version; missing files are part of the signature too
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+def read_pcd_header(path):
+    # Parse the ASCII header only; data_offset is where the point data starts
+    header = {}
+    with open(path, 'rb') as f:
+        while True:
+            line = f.readline()
+            if not line:
+                break
+            fields = line.decode('ascii', errors='replace').split()
+            if not fields or fields[0].startswith('#'):
+                continue
+            header[fields[0].upper()] = fields[1:]
+            if fields[0].upper() == 'DATA':
+                break
+        header['offset'] = f.tell()
+    return header
+
+def read_label_histogram(path):
+    if path is None or not os.path.exists(path):
+        return None
+    # One label per point and line; class names such as 'Fork lift' contain spaces
+    with open(path) as f:
+        labels = [line for line in f.read().splitlines() if line]
+    histogram = {}
+    for label in labels:
+        histogram[label] = histogram.get(label, 0) + 1
+    return histogram
+
+def scan_frame(path):
+    stem = os.path.splitext(path)[0]
+    manual_labels_path = stem + MANUAL_LABELS_SUFFIX
+    auto_labels_path = stem + AUTO_LABELS_SUFFIX
+    header = read_pcd_header(path)
+    manual = read_label_histogram(manual_labels_path)
+    auto = read_label_histogram(auto_labels_path)
+
+    if not manual or set(manual) == {UNLABELED}:
+        manual_status = 'none'
+    elif UNLABELED in manual:
+        manual_status = 'partial'
+    else:
+        manual_status = 'complete'
+
+    num_points = header.get('POINTS')
+    return {
+        'kind': 'frame',
+        'path': path,
+        'directory': os.path.dirname(path),
+        'num_points': int(num_points[0]) if num_points else None,
+        'fields': ' '.join(header.get('FIELDS', [])),
+        'data_format': (header.get('DATA') or [None])[0],
+        'data_offset': header['offset'],
+        'manual_status': manual_status,
+        'has_auto_labels': auto is not None,
+        'manual_labels_path': manual_labels_path if manual is not None else None,
+        'auto_labels_path': auto_labels_path if auto is not None else None,
+        'label_counts': {'manual': manual or {}, 'auto': auto or {}},
+    }
+
+def scan_recording(path, dataset='radar_samples'):
+    import h5py
+
+    with h5py.File(path, 'r') as f:
+        if dataset not in f:
+            return {'kind': 'recording', 'path': path, 'dataset': None, 'num_samples': None,
+                    'dtype': None, 'data_offset': None}
+        samples = f[dataset]
+        # Only contiguous datasets have a single byte offset; chunked ones report None
+        return {
+            'kind': 'recording',
+            'path': path,
+            'dataset': dataset,
+            'num_samples': int(samples.shape[0]) if samples.shape else 1,
+            'dtype': str(samples.dtype),
+            'data_offset': samples.id.get_offset(),
+        }
+
+def scan_path(kind, path):
+    try:
+        return scan_frame(path) if kind == 'frame' else scan_recording(path)
+    except Exception as e:
+        logging.error(f'Error scanning {path}: {e}')
+        return None
+
+class DatasetCatalog:
+    def __init__(self, db_path='dataset_catalog.db'):
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute('PRAGMA foreign_keys = ON')
+        self.conn.execute('PRAGMA journal_mode = WAL')
+        self.conn.executescript(SCHEMA)
+
+    def find_files(self, dataset_dir):
+        # Returns {path: (kind, signature)}; a frame's signature covers its label files as well
+        files = {}
+        for root, _, names in os.walk(dataset_dir):
+            for name in names:
+                path = os.path.abspath(os.path.join(root, name))
+                extension = os.path.splitext(name)[1].lower()
+                if extension in FRAME_EXTENSIONS:
+                    stem = os.path.splitext(path)[0]
+                    signature = [file_signature(p) for p in (path, stem + MANUAL_LABELS_SUFFIX,
+                                                             stem + AUTO_LABELS_SUFFIX)]
+                    files[path] = ('frame', json.dumps(signature))
+                elif extension in RECORDING_EXTENSIONS:
+                    files[path] = ('recording', json.dumps(file_signature(path)))
+        return files
+
+    def scan(self, dataset_dir, workers=None):
+        # Incremental: only files whose (mtime, size) signature changed are re-read, in parallel
+        dataset_dir = os.path.abspath(dataset_dir)
+        files = self.find_files(dataset_dir)
+        known = {}
+        prefix = os.path.join(dataset_dir, '')
+        for table in ('frames', 'recordings'):
+            for row in self.conn.execute(f"SELECT path, signature FROM {table} WHERE path LIKE ? ESCAPE '\\'",
+                                         (prefix.replace('%', r'\%').replace('_', r'\_') + '%',)):
+                known[row['path']] = (table, row['signature'])
+
+        changed = [(kind, path) for path, (kind, signature) in files.items()
+                   if known.get(path, (None, None))[1] != signature]
+        removed = [(table, path) for path, (table, _) in known.items() if path not in files]
+
+        results = []
+        if changed:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                kinds, paths = zip(*changed)
+                results = list(executor.map(scan_path, kinds, paths, chunksize=max(1, len(changed) // 64)))
+
+        scanned_at = time.time()
+        with self.conn:
+            for table, path in removed:
+                self.conn.execute(f'DELETE FROM {table} WHERE path = ?', (path,))
+            for (kind, path), result in zip(changed, results):
+                if result is None:
+                    # Drop the stale row of a file that no longer reads; it is retried on the next scan
+                    self.conn.execute(f"DELETE FROM {'frames' if kind == 'frame' else 'recordings'} WHERE path = ?",
+                                      (path,))
+                    continue
+                signature = files[result['path']][1]
+                if result['kind'] == 'frame':
+                    self.store_frame(result, signature, scanned_at)
+                else:
+                    self.store_recording(result, signature, scanned_at)
+
+        scanned = sum(result is not None for result in results)
+        return {'scanned': scanned, 'failed': len(results) - scanned,
+                'unchanged': len(files) - len(changed), 'removed': len(removed)}
+
+    def store_frame(self, frame, signature, scanned_at):
+        self.conn.execute('DELETE FROM label_counts WHERE frame = ?', (frame['path'],))
+        self.conn.execute(
+            'INSERT OR REPLACE INTO frames (path, signature, directory, num_points, fields, data_format, data_offset, '
+            'manual_status, has_auto_labels, manual_labels_path, auto_labels_path, scanned_at) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+            (frame['path'], signature, frame['directory'], frame['num_points'], frame['fields'],
+             frame['data_format'], frame['data_offset'], frame['manual_status'], int(frame['has_auto_labels']),
+             frame['manual_labels_path'], frame['auto_labels_path'], scanned_at))
+        self.conn.executemany(
+            'INSERT INTO label_counts (frame, source, label, count) VALUES (?, ?, ?, ?)',
+            [(frame['path'], source, label, count)
+             for source, histogram in frame['label_counts'].items() for label, count in histogram.items()])
+
+    def store_recording(self, recording, signature, scanned_at):
+        self.conn.execute(
+            'INSERT OR REPLACE INTO recordings (path, signature, dataset, num_samples, dtype, data_offset, scanned_at) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?)',
+            (recording['path'], signature, recording['dataset'], recording['num_samples'], recording['dtype'],
+             recording['data_offset'], scanned_at))
+
+    def find_frames(self, label=None, min_points=1, source='auto', manual_status=None, has_auto_labels=None,
+                    limit=None):
+        # min_points counts labelled points, not objects. E.g. frames with at least 4 auto-labelled
+        # pedestrian points and no manual labels:
+        #   find_frames('Pedestrian', min_points=4, manual_status='none')
+        query = 'SELECT f.*'
+        params = []
+        if label is not None:
+            query += ', c.count AS label_count FROM frames f JOIN label_counts c ON c.frame = f.path ' \
+                     'AND c.source = ? AND c.label = ? AND c.count >= ?'
+            params += [source, label, min_points]
+        else:
+            query += ' FROM frames f'
+        conditions = []
+        if manual_status is not None:
+            conditions.append('f.manual_status = ?')
+            params.append(manual_status)
+        if has_auto_labels is not None:
+            conditions.append('f.has_auto_labels = ?')
+            params.append(int(has_auto_labels))
+        if conditions:
+            query += ' WHERE ' + ' AND '.join(conditions)
+        query += ' ORDER BY label_count DESC, f.path' if label is not None else ' ORDER BY f.path'
+        if limit is not None:
+            query += ' LIMIT ?'
+            params.append(limit)
+        return [dict(row) for row in self.conn.execute(query, params)]
+
+    def label_counts(self, frame):
+        counts = {'manual': {}, 'auto': {}}
+        for row in self.conn.execute('SELECT source, label, count FROM label_counts WHERE frame = ?', (frame,)):
+            counts[row['source']][row['label']] = row['count']
+        return counts
+
+    def label_totals(self, source='auto'):
+        rows = self.conn.execute('SELECT label, SUM(count) AS total, COUNT(*) AS frames FROM label_counts '
+                                 'WHERE source = ? GROUP BY label ORDER BY total DESC', (source,))
+        return [dict(row) for row in rows]
+
+    def recordings(self):
+        return [dict(row) for row in self.conn.execute('SELECT * FROM recordings ORDER BY path')]
+
+    def as_queue(self, frames):
+        # Entries in the format RadarPointCloudLabeler takes as a work queue
+        return [{
+            'frame': frame['path'],
+            'manual_labels': os.path.splitext(frame['path'])[0] + MANUAL_LABELS_SUFFIX,
+            'auto_labels': frame['auto_labels_path'],
+            'score': float(frame.get('label_count') or 0),
+        } for frame in frames]
+
+    def close(self):
+        self.conn.close()
+
+def main():
+    parser = argparse.ArgumentParser(description='Index radar recordings, frames and labels into SQLite.')
+    parser.add_argument('--db', default='dataset_catalog.db')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    scan_parser = commands.add_parser('scan', help='scan a dataset directory, re-reading only changed files')
+    scan_parser.add_argument('dataset_dir')
+    scan_parser.add_argument('--workers', type=int, default=None)
+
+    query_parser = commands.add_parser('query', help='list frames by label count and manual label status')
+    query_parser.add_argument('--label')
+    query_parser.add_argument('--min-points', type=int, default=1,
+                              help='minimum number of points with the label in a frame (points, not objects)')
+    query_parser.add_argument('--source', choices=('auto', 'manual'), default='auto')
+    query_parser.add_argument('--manual-status', choices=('none', 'partial', 'complete'))
+    query_parser.add_argument('--limit', type=int)
+    query_parser.add_argument('--queue', help='write the result as a labelling queue for the manual labeller')
+
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    catalog = DatasetCatalog(args.db)
+    try:
+        if args.command == 'scan':
+            start = time.perf_counter()
+            stats = catalog.scan(args.dataset_dir, args.workers)
+            print(f"{stats} in {time.perf_counter() - start:.2f} s")
+        else:
+            start = time.perf_counter()
+            frames = catalog.find_frames(args.label, args.min_points, args.source, args.manual_status,
+                                         limit=args.limit)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            for frame in frames:
+                print(f"{frame['path']}  points={frame['num_points']}  manual={frame['manual_status']}"
+                      + (f"  {args.label}={frame['label_count']}" if args.label else ''))
+            print(f"{len(frames)} frames in {elapsed_ms:.1f} ms")
+            if args.queue:
+                with open(args.queue, 'w') as f:
+                    json.dump(catalog.as_queue(frames), f, indent=2)
+    finally:
+        catalog.close()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,168 @@
+import os
+import sys
+import glob
+import json
+import logging
+import numpy as np
+
+from radarpointcloudlabeller import (load_point_cloud, load_labels, UNLABELED, MANUAL_LABELS_SUFFIX,
+                                     AUTO_LABELS_SUFFIX, AUTO_SCORES_SUFFIX, AUTO_SCORE_PASSES_SUFFIX)
+
+# Relative weight of each uncertainty signal in a point's priority
+DEFAULT_WEIGHTS = {'confidence': 1.0, 'disagreement': 1.0, 'variance': 1.0}
+# Regions are scored as if they held at least this many points, so sparse cells cannot dominate
+MIN_REGION_POINTS = 5
+
+def frame_files(point_cloud_path):
+    stem = os.path.splitext(point_cloud_path)[0]
+    return {
+        'frame': point_cloud_path,
+        'manual_labels': stem + MANUAL_LABELS_SUFFIX,
+        'auto_labels': stem + AUTO_LABELS_SUFFIX,
+        'auto_scores': stem + AUTO_SCORES_SUFFIX,
+        'auto_score_passes': stem + AUTO_SCORE_PASSES_SUFFIX,
+    }
+
+def load_frame(point_cloud_path):
+    # Returns None for frames the autolabeller has not scored yet and for frames whose label files
+    # do not match the point cloud, so one stale file cannot abort a whole queue build
+    files = frame_files(point_cloud_path)
+    if not (os.path.exists(files['auto_labels']) and os.path.exists(files['auto_scores'])):
+        logging.info(f'Skipping {point_cloud_path}: no auto labels')
+        return None
+
+    points = np.asarray(load_point_cloud(point_cloud_path).points)
+    auto_labels = np.atleast_1d(load_labels(files['auto_labels']))
+    scores = np.loadtxt(files['auto_scores'], ndmin=1)
+    manual_labels = np.full(len(points), UNLABELED)
+    if os.path.exists(files['manual_labels']):
+        manual_labels = np.atleast_1d(load_labels(files['manual_labels']))
+    score_passes = None
+    if os.path.exists(files['auto_score_passes']):
+        score_passes = np.loadtxt(files['auto_score_passes'], ndmin=2)
+
+    lengths = {'auto_labels': len(auto_labels), 'auto_scores': len(scores), 'manual_labels': len(manual_labels)}
+    if score_passes is not None:
+        lengths['auto_score_passes'] = score_passes.shape[1]
+    mismatched = [f'{name} has {length}' for name, length in lengths.items() if length != len(points)]
+    if mismatched:
+        logging.warning(f'Skipping {point_cloud_path}: {len(points)} points but {", ".join(mismatched)}')
+        return None
+
+    return {
+        'files': files,
+        'points': points,
+        'auto_labels': auto_labels,
+        'manual_labels': manual_labels,
+        'scores': scores,
+        'score_passes': score_passes,
+    }
+
+def score_variance(score_passes, num_points):
+    # Scores lie in [0, 1], so their variance across passes is at most 0.25
+    if score_passes is None:
+        return np.zeros(num_points)
+    return 4.0 * np.var(score_passes, axis=0)
+
+def point_uncertainty(scores, auto_labels, manual_labels, variance, weights=DEFAULT_WEIGHTS):
+    # Confidence term peaks at a score of 0.5 and is zero for confident detections and clear background
+    confidence = 1.0 - np.abs(2.0 * scores - 1.0)
+    # Points an annotator already labelled need no more work; where they overrode the auto label
+    # counts as disagreement, which score_batch applies per frame to the remaining points
+    manual = manual_labels != UNLABELED
+    disagreement = (manual & (manual_labels != auto_labels)).astype(float)
+
+    priority = weights['confidence'] * confidence + weights['variance'] * variance
+    priority[manual] = 0.0
+    return priority, confidence, disagreement, variance, manual
+
+def score_batch(frames, region_size=2.0, weights=DEFAULT_WEIGHTS, top_regions=5, min_region_points=MIN_REGION_POINTS):
+    # Score all points of a batch of frames at once; frame_idx tags each point with its frame
+    counts = np.array([len(frame['points']) for frame in frames])
+    frame_idx = np.repeat(np.arange(len(frames)), counts)
+    points = np.concatenate([frame['points'][:, :3] for frame in frames])
+    # Frames may have different numbers of augmentation passes, so variance is taken per frame
+    variance = np.concatenate([score_variance(frame['score_passes'], count) for frame, count in zip(frames, counts)])
+
+    priority, confidence, disagreement, variance, manual = point_uncertainty(
+        np.concatenate([frame['scores'] for frame in frames]),
+        np.concatenate([frame['auto_labels'] for frame in frames]),
+        np.concatenate([frame['manual_labels'] for frame in frames]),
+        variance, weights)
+
+    safe_counts = np.maximum(counts, 1)
+    frame_means = {name: np.bincount(frame_idx, weights=values, minlength=len(frames)) / safe_counts
+                   for name, values in (('confidence', confidence), ('variance', variance))}
+    manual_counts = np.bincount(frame_idx, weights=manual, minlength=len(frames))
+    # Share of manually labelled points where the annotator overrode the auto label. Corrections are
+    # evidence that the auto labels on the rest of the frame are unreliable too, so they scale up
+    # the priority of its unlabelled points.
+    frame_means['disagreement'] = (np.bincount(frame_idx, weights=disagreement, minlength=len(frames)) /
+                                   np.maximum(manual_counts, 1))
+    priority = priority * (1.0 + weights['disagreement'] * frame_means['disagreement'][frame_idx])
+
+    # Regions are ground-plane grid cells of region_size; a frame ranks by its most uncertain region.
+    # A region's score is its summed priority over at least min_region_points points, so a single
+    # uncertain point scores no higher than a fifth of a full cell of them by default.
+    cells = np.floor(points[:, :2] / region_size).astype(np.int64)
+    region_keys, region_idx = np.unique(np.column_stack([frame_idx, cells]), axis=0, return_inverse=True)
+    region_idx = region_idx.ravel()
+    region_counts = np.bincount(region_idx)
+    region_scores = np.bincount(region_idx, weights=priority) / np.maximum(region_counts, min_region_points)
+    region_centers = np.column_stack([np.bincount(region_idx, weights=points[:, 0]),
+                                      np.bincount(region_idx, weights=points[:, 1])]) / region_counts[:, None]
+    region_frame = region_keys[:, 0]
+
+    frame_scores = np.zeros(len(frames))
+    np.maximum.at(frame_scores, region_frame, region_scores)
+
+    entries = []
+    for i, frame in enumerate(frames):
+        regions = np.nonzero(region_frame == i)[0]
+        regions = regions[np.argsort(-region_scores[regions])][:top_regions]
+        entries.append({
+            'frame': frame['files']['frame'],
+            'auto_labels': frame['files']['auto_labels'],
+            'manual_labels': frame['files']['manual_labels'],
+            'score': float(frame_scores[i]),
+            'confidence_uncertainty': float(frame_means['confidence'][i]),
+            'disagreement': float(frame_means['disagreement'][i]),
+            'ensemble_variance': float(frame_means['variance'][i]),
+            'manual_fraction': float(manual_counts[i] / max(counts[i], 1)),
+            'regions': [{'center': region_centers[r].tolist(), 'score': float(region_scores[r]),
+                         'num_points': int(region_counts[r])} for r in regions],
+        })
+    return entries
+
+def build_queue(dataset_dir, batch_size=64, region_size=2.0, weights=DEFAULT_WEIGHTS):
+    paths = sorted(glob.glob(os.path.join(dataset_dir, '**', '*.pcd'), recursive=True))
+    entries = []
+    for start in range(0, len(paths), batch_size):
+        frames = [load_frame(path) for path in paths[start:start + batch_size]]
+        # Fully labelled frames have nothing left to review
+        frames = [frame for frame in frames
+                  if frame is not None and np.any(frame['manual_labels'] == UNLABELED)]
+        if frames:
+            entries.extend(score_batch(frames, region_size, weights))
+    entries.sort(key=lambda entry: entry['score'], reverse=True)
+    return entries
+
+def save_queue(queue, path):
+    with open(path, 'w') as f:
+        json.dump(queue, f, indent=2)
+
+def load_queue(path):
+    with open(path) as f:
+        return json.load(f)
+
+def main():
+    dataset_dir = sys.argv[1] if len(sys.argv) > 1 else '.'
+    queue_path = sys.argv[2] if len(sys.argv) > 2 else 'labelling_queue.json'
+    queue = build_queue(dataset_dir)
+    save_queue(queue, queue_path)
+    print(f"Ranked {len(queue)} frames into {queue_path}")
+    for entry in queue[:10]:
+        print(f"{entry['score']:.3f}  {entry['frame']}")
+
+if __name__ == '__main__':
+    main()
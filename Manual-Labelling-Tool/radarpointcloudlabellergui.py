@@ -0,0 +1,185 @@
+import os
+import numpy as np
+import open3d as o3d
+from PyQt5.QtWidgets import QMainWindow, QVBoxLayout, QHBoxLayout, QWidget, QPushButton, QListWidget, QLineEdit, QLabel
+from PyQt5.QtCore import Qt
+
+from radarpointcloudlabeller import load_point_cloud, load_labels, save_labels, UNLABELED, main
+
+class RadarPointCloudLabeler(QMainWindow):
+    def __init__(self, point_cloud_path=None, queue=None):
+        super().__init__()
+        # A queue from labellingqueue.py lists frames most-uncertain first, with their auto labels
+        self.queue = queue or []
+        self.queue_position = 0
+        self.label_colors = {}
+        self.selected_points = []
+        self.current_label = UNLABELED
+        if self.queue:
+            self.load_frame(self.queue[0])
+        else:
+            self.load_frame({'frame': point_cloud_path})
+        self.init_ui()
+
+    def load_point_cloud(self, path):
+        return load_point_cloud(path)
+
+    def load_frame(self, entry):
+        self.point_cloud = self.load_point_cloud(entry['frame'])
+        self.labels_path = entry.get('manual_labels', "point_cloud_labels.txt")
+        num_points = len(self.point_cloud.points)
+
+        # Queued frames show the preloaded auto labels with earlier manual work on top. Only points
+        # marked in manual_points are written back, so auto labels never reach the manual labels file.
+        self.labels = [UNLABELED] * num_points
+        self.manual_points = np.zeros(num_points, dtype=bool)
+        self.labels_modified = False
+        if 'manual_labels' in entry:
+            auto_labels = self.read_frame_labels(entry.get('auto_labels'), num_points)
+            if auto_labels is not None:
+                self.labels = list(auto_labels)
+            manual_labels = self.read_frame_labels(entry['manual_labels'], num_points)
+            if manual_labels is not None:
+                self.manual_points = manual_labels != UNLABELED
+                for point in np.nonzero(self.manual_points)[0]:
+                    self.labels[point] = manual_labels[point]
+
+    def read_frame_labels(self, labels_path, num_points):
+        if not labels_path or not os.path.exists(labels_path):
+            return None
+        labels = np.atleast_1d(load_labels(labels_path))
+        return labels if len(labels) == num_points else None
+
+    def init_ui(self):
+        self.setWindowTitle('Radar Point Cloud Labeler')
+        self.setGeometry(100, 100, 800, 600)
+
+        main_widget = QWidget()
+        self.setCentralWidget(main_widget)
+
+        layout = QHBoxLayout()
+        main_widget.setLayout(layout)
+
+        # Left panel for controls
+        left_panel = QVBoxLayout()
+
+        self.label_input = QLineEdit()
+        self.label_input.setPlaceholderText("Enter label")
+        left_panel.addWidget(self.label_input)
+
+        self.add_label_btn = QPushButton("Add Label")
+        self.add_label_btn.clicked.connect(self.add_label)
+        left_panel.addWidget(self.add_label_btn)
+
+        self.label_list = QListWidget()
+        self.label_list.itemClicked.connect(self.select_label)
+        left_panel.addWidget(self.label_list)
+
+        self.apply_label_btn = QPushButton("Apply Label")
+        self.apply_label_btn.clicked.connect(self.apply_label)
+        left_panel.addWidget(self.apply_label_btn)
+
+        self.save_btn = QPushButton("Save Labels")
+        self.save_btn.clicked.connect(self.save_labels)
+        left_panel.addWidget(self.save_btn)
+
+        # Work queue, ranked by model uncertainty
+        self.queue_list = QListWidget()
+        for entry in self.queue:
+            self.queue_list.addItem(f"{entry['score']:.3f}  {os.path.basename(entry['frame'])}")
+        self.queue_list.itemClicked.connect(self.select_queue_item)
+        self.next_frame_btn = QPushButton("Save and Next Frame")
+        self.next_frame_btn.clicked.connect(self.next_frame)
+        if self.queue:
+            self.queue_list.setCurrentRow(0)
+            left_panel.addWidget(QLabel("Labelling Queue:"))
+            left_panel.addWidget(self.queue_list)
+            left_panel.addWidget(self.next_frame_btn)
+
+        layout.addLayout(left_panel)
+
+        # Right panel for point cloud visualization
+        self.vis = o3d.visualization.Visualizer()
+        self.vis.create_window()
+        self.vis.add_geometry(self.point_cloud)
+
+        # Set up a custom Qt widget to embed the Open3D visualization
+        self.vis_widget = QWidget.createWindowContainer(self.vis.get_render_window())
+        layout.addWidget(self.vis_widget, stretch=1)
+
+        self.update_label_list()
+        self.update_point_cloud_colors()
+
+    def update_label_list(self):
+        # Make preloaded labels selectable
+        existing = [self.label_list.item(i).text() for i in range(self.label_list.count())]
+        for label in sorted(set(self.labels) - set(existing) - {UNLABELED}):
+            self.label_list.addItem(label)
+
+    def show_queue_entry(self, position):
+        self.queue_position = position
+        self.queue_list.setCurrentRow(position)
+        self.load_frame(self.queue[position])
+        self.selected_points.clear()
+        self.vis.clear_geometries()
+        self.vis.add_geometry(self.point_cloud)
+        self.update_label_list()
+        self.update_point_cloud_colors()
+
+    def select_queue_item(self, item):
+        if self.labels_modified:
+            self.save_labels()
+        self.show_queue_entry(self.queue_list.row(item))
+
+    def next_frame(self):
+        if self.labels_modified:
+            self.save_labels()
+        if self.queue_position + 1 < len(self.queue):
+            self.show_queue_entry(self.queue_position + 1)
+
+    def add_label(self):
+        label = self.label_input.text()
+        if label and label not in [self.label_list.item(i).text() for i in range(self.label_list.count())]:
+            self.label_list.addItem(label)
+            self.label_input.clear()
+
+    def select_label(self, item):
+        self.current_label = item.text()
+
+    def apply_label(self):
+        for point in self.selected_points:
+            self.labels[point] = self.current_label
+            self.manual_points[point] = True
+        if self.selected_points:
+            self.labels_modified = True
+        self.update_point_cloud_colors()
+        self.selected_points.clear()
+
+    def update_point_cloud_colors(self):
+        colors = []
+        for label in self.labels:
+            if label == UNLABELED:
+                colors.append([0.5, 0.5, 0.5])  # Gray for unlabeled
+            else:
+                # Generate a unique color for each label, kept for the whole session
+                if label not in self.label_colors:
+                    self.label_colors[label] = np.random.rand(3)
+                colors.append(self.label_colors[label])
+
+        self.point_cloud.colors = o3d.utility.Vector3dVector(colors)
+        self.vis.update_geometry(self.point_cloud)
+        self.vis.poll_events()
+        self.vis.update_renderer()
+
+    def save_labels(self):
+        # Save only the labels an annotator applied; preloaded auto labels stay out of the file
+        manual_labels = np.where(self.manual_points, np.array(self.labels, dtype=object), UNLABELED)
+        save_labels(manual_labels, self.labels_path)
+        self.labels_modified = False
+        print(f"Labels saved to {self.labels_path}")
+
+    def closeEvent(self, event):
+        self.vis.destroy_window()
+
+if __name__ == '__main__':
+    main()
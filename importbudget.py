@@ -0,0 +1,47 @@
+import os
+import sys
+import subprocess
+
+# Headless entry points of each tool and the import-time budget they must meet
+# in a fresh interpreter (numpy included). GUI, plotting, hardware and model
+# libraries must not be pulled in by these imports.
+IMPORT_BUDGET_MS = 250
+HEADLESS_MODULES = {
+    'Auto-Labelling': 'autolabeller',
+    'Data-Extraction': 'radarrawdataextractor',
+    'Data-Visualisation': 'radardatavisualization',
+    'Manual-Labelling-Tool': 'radarpointcloudlabeller',
+}
+HEAVY_MODULES = ('PyQt5', 'open3d', 'torch', 'sklearn', 'pointnet2_ops', 'pointrcnn',
+                 'matplotlib', 'rtlsdr', 'h5py')
+
+def measure_import(tool_dir, module):
+    check = (f"import sys, {module}; "
+             f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))")
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', check],
+                            cwd=tool_dir, capture_output=True, text=True, check=True)
+
+    # The last importtime line for the module holds its cumulative import time in microseconds
+    cumulative_us = 0
+    for line in result.stderr.splitlines():
+        fields = [field.strip() for field in line.split('|')]
+        if len(fields) == 3 and fields[2] == module:
+            cumulative_us = int(fields[1])
+    heavy = [name for name in result.stdout.strip().split(',') if name]
+    return cumulative_us / 1000.0, heavy
+
+def main():
+    root = os.path.dirname(os.path.abspath(__file__))
+    failed = False
+    for tool_dir, module in HEADLESS_MODULES.items():
+        elapsed_ms, heavy = measure_import(os.path.join(root, tool_dir), module)
+        status = 'ok'
+        if heavy or elapsed_ms > IMPORT_BUDGET_MS:
+            status = 'FAIL'
+            failed = True
+        print(f"{module:<28} {elapsed_ms:8.1f} ms  {status}" + (f"  (loaded: {', '.join(heavy)})" if heavy else ''))
+    print(f"Budget: {IMPORT_BUDGET_MS} ms per module")
+    sys.exit(1 if failed else 0)
+
+if __name__ == '__main__':
+    main()